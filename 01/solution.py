@@ -1,6 +1,28 @@
 import collections
 import heapq
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def readTotals(input_file):
+    """
+    Read the calories of all the elves in bulk.
+    :return: numpy array with the total calories of each elf
+    """
+    with open(input_file, "rb") as hand:
+        data = hand.read().replace(b"\r", b"").strip()
+    calories = np.fromstring(data, dtype=np.int64, sep=" ")
+    newlines = np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == ord("\n"))
+    # A blank line ends right after the previous one
+    blank_lines = np.flatnonzero(np.diff(newlines) == 1) + 1
+    # Index of the first calories of each pack, skipping the blank lines before it.
+    # Consecutive blank lines give the same index, as they only end an empty pack
+    starts = np.unique(blank_lines - np.arange(len(blank_lines)))
+    return np.add.reduceat(calories, np.concatenate(([0], starts)))
+
 
 class Solver:
     def __init__(self):
@@ -23,15 +45,69 @@ class Solver:
             top_calories = max(top_calories, sum(elf_pack))
         return top_calories
 
-    def solve2(self):
+    def topCalories(self, k):
+        """
+        :return: total calories carried by the k elves carrying the most
+        """
         top_calories = list()
         heapq.heapify(top_calories)
         for elf_pack in self.data:
             heapq.heappush(top_calories, sum(elf_pack))
-            if len(top_calories) > 3:
+            if len(top_calories) > k:
                 heapq.heappop(top_calories)
         return sum(top_calories)
 
+    def solve2(self):
+        return self.topCalories(3)
+
+    def solveStream(self, lines):
+        """
+        Compute both solutions in one pass over the lines of an input,
+        without storing the packs.
+        """
+        top_calories = [0, 0, 0]
+        current = 0
+        for line in lines:
+            line = line.strip()
+            if len(line) == 0:
+                heapq.heappushpop(top_calories, current)
+                current = 0
+                continue
+            current += int(line)
+        heapq.heappushpop(top_calories, current)
+        return max(top_calories), sum(top_calories)
+
+
+class NumpySolver(Solver):
+    """
+    Same solutions computed on the array of the totals of each elf.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.totals = None
+
+    def parse(self, input_file):
+        self.totals = readTotals(input_file)
+
+    def topCalories(self, k):
+        if k <= 0:
+            return 0
+        if k >= len(self.totals):
+            return int(self.totals.sum())
+        return int(np.partition(self.totals, -k)[-k:].sum())
+
+    def solve1(self):
+        return int(self.totals.max())
+
+    def solve2(self):
+        return self.topCalories(3)
+
+
+BACKENDS = {"python": Solver}
+if np is not None:
+    BACKENDS["numpy"] = NumpySolver
+
 
 if __name__ == "__main__":
     solver = Solver()
@@ -36,39 +36,68 @@ class Solver:
     }
 
     def __init__(self):
-        self.data = None
+        self.rounds = None
+        # Score of each of the 9 possible rounds, by raw line
+        self.scores1 = dict()
+        self.scores2 = dict()
+        for elf in "ABC":
+            for me in "XYZ":
+                line = ("%s %s" % (elf, me)).encode()
+                self.scores1[line] = self.getScore1((elf, me))
+                self.scores2[line] = self.getScore2((elf, me))
+
+    def countRounds(self, lines):
+        """
+        :return: Counter of the stripped raw lines
+        """
+        rounds = collections.Counter()
+        for line, count in collections.Counter(lines).items():
+            line = line.strip()
+            if len(line) > 0:
+                rounds[line] += count
+        return rounds
 
     def parse(self, input_file):
-        self.data = list()
-        with open(input_file, "r") as hand:
-            for line in hand:
-                line = line.strip().split(" ", maxsplit=2)
-                self.data.append(line)
-
-    def solve1(self):
+        with open(input_file, "rb") as hand:
+            self.rounds = self.countRounds(hand)
+
+    def getScore1(self, moves):
+        elf, me = list(map(lambda m: Solver.CONVERTER[m], moves))
+        result = check_winner(elf, me)
+        return 3 * result + SHAPE_TO_SCORE[me]
+
+    def getScore2(self, moves):
+        elf, result = moves
+        elf = Solver.CONVERTER[elf]
+        if result == 'X':
+            # lose
+            me = VAL_TO_SHAPE[(SHAPE_TO_VAL[elf] - 1) % 3]
+        elif result == 'Y':
+            # draw
+            me = elf
+        else:
+            # win
+            me = VAL_TO_SHAPE[(SHAPE_TO_VAL[elf] + 1) % 3]
+        return 3 * Solver.SCORE_CONVERTER[result] + SHAPE_TO_SCORE[me]
+
+    def getTotalScore(self, rounds, scores):
         score = 0
-        for moves in self.data:
-            elf, me = list(map(lambda m: Solver.CONVERTER[m], moves))
-            result = check_winner(elf, me)
-            score += (3 * result + SHAPE_TO_SCORE[me])
+        for line, count in rounds.items():
+            score += scores[line] * count
         return score
 
+    def solve1(self):
+        return self.getTotalScore(self.rounds, self.scores1)
+
     def solve2(self):
-        score = 0
-        for moves in self.data:
-            elf, result = moves
-            elf = Solver.CONVERTER[elf]
-            if result == 'X':
-                # lose
-                me = VAL_TO_SHAPE[(SHAPE_TO_VAL[elf] - 1) % 3]
-            elif result == 'Y':
-                # draw
-                me = elf
-            else:
-                # win
-                me = VAL_TO_SHAPE[(SHAPE_TO_VAL[elf] + 1) % 3]
-            score += (3 * Solver.SCORE_CONVERTER[result] + SHAPE_TO_SCORE[me])
-        return score
+        return self.getTotalScore(self.rounds, self.scores2)
+
+    def solveStream(self, lines):
+        """
+        Compute both solutions in one pass over the lines of an input.
+        """
+        rounds = self.countRounds(line.encode() if isinstance(line, str) else line for line in lines)
+        return self.getTotalScore(rounds, self.scores1), self.getTotalScore(rounds, self.scores2)
 
 
 if __name__ == "__main__":
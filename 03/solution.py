@@ -18,25 +18,48 @@ class Solver:
                 line = line.strip()
                 self.data.append(line)
 
+    def getRucksackPriority(self, rucksack):
+        first_half = set(rucksack[:len(rucksack) // 2])
+        second_half = set(rucksack[len(rucksack)//2:])
+        common = first_half.intersection(second_half).pop()
+        return get_priority(common)
+
+    def getGroupPriority(self, group):
+        common_items = set(group[0])
+        common_items = common_items.intersection(group[1])
+        common_items = common_items.intersection(group[2])
+        common = common_items.pop()
+        return get_priority(common)
+
     def solve1(self):
         tot_priorities = 0
         for rucksack in self.data:
-            first_half = set(rucksack[:len(rucksack) // 2])
-            second_half = set(rucksack[len(rucksack)//2:])
-            common = first_half.intersection(second_half).pop()
-            tot_priorities += get_priority(common)
+            tot_priorities += self.getRucksackPriority(rucksack)
         return tot_priorities
 
     def solve2(self):
         tot_priorities = 0
         for group in range(int(len(self.data)//3)):
-            common_items = set(self.data[3 * group])
-            common_items = common_items.intersection(self.data[3 * group + 1])
-            common_items = common_items.intersection(self.data[3 * group + 2])
-            common = common_items.pop()
-            tot_priorities += get_priority(common)
+            tot_priorities += self.getGroupPriority(self.data[3 * group:3 * group + 3])
         return tot_priorities
 
+    def solveStream(self, lines):
+        """
+        Compute both solutions in one pass over the lines of an input,
+        keeping only the rucksacks of the current group.
+        """
+        tot_priorities1 = 0
+        tot_priorities2 = 0
+        group = list()
+        for line in lines:
+            rucksack = line.strip()
+            tot_priorities1 += self.getRucksackPriority(rucksack)
+            group.append(rucksack)
+            if len(group) == 3:
+                tot_priorities2 += self.getGroupPriority(group)
+                group = list()
+        return tot_priorities1, tot_priorities2
+
 
 if __name__ == "__main__":
     solver = Solver()
@@ -1,3 +1,9 @@
+import bisect
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 def contains(interval1, interval2):
@@ -13,19 +19,101 @@ def overlap(interval1, interval2):
     return interval2[0] <= interval1[0] <= interval2[1] or \
             interval1[0] <= interval2[0] <= interval1[1]
 
+
+class IntervalIndex:
+    """
+    Static index of closed intervals counting the ones overlapping,
+    contained in or containing a query interval.
+    The intervals are sorted by start and a merge sort tree keeps,
+    for each node, the sorted ends of the intervals below it,
+    so that containment queries take O(log^2 n).
+    """
+
+    def __init__(self, intervals):
+        intervals = sorted(map(tuple, intervals))
+        self.starts = [start for start, _ in intervals]
+        self.ends = sorted(end for _, end in intervals)
+        self.size = 1
+        while self.size < len(intervals):
+            self.size *= 2
+        self.tree = [list() for _ in range(2 * self.size)]
+        for i, (_, end) in enumerate(intervals):
+            self.tree[self.size + i].append(end)
+        for node in range(self.size - 1, 0, -1):
+            self.tree[node] = sorted(self.tree[2 * node] + self.tree[2 * node + 1])
+
+    def __len__(self):
+        return len(self.starts)
+
+    def countEnds(self, lo, hi, bound, search=bisect.bisect_right):
+        """
+        :return: number of intervals between positions lo and hi (excluded)
+            in start order with end <= bound (< bound with bisect_left)
+        """
+        count = 0
+        lo += self.size
+        hi += self.size
+        while lo < hi:
+            if lo & 1:
+                count += search(self.tree[lo], bound)
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                count += search(self.tree[hi], bound)
+            lo //= 2
+            hi //= 2
+        return count
+
+    def countOverlapping(self, start, end):
+        # The intervals starting after the end and the ones ending before the start are disjoint sets
+        after = len(self.starts) - bisect.bisect_right(self.starts, end)
+        before = bisect.bisect_left(self.ends, start)
+        return len(self.starts) - after - before
+
+    def countContained(self, start, end):
+        lo = bisect.bisect_left(self.starts, start)
+        hi = bisect.bisect_right(self.starts, end)
+        return self.countEnds(lo, hi, end)
+
+    def countContaining(self, start, end):
+        hi = bisect.bisect_right(self.starts, start)
+        return hi - self.countEnds(0, hi, end, bisect.bisect_left)
+
+
 class Solver:
 
     def __init__(self):
         self.data = None
+        self.index = None
+
+    def parseLine(self, line):
+        line = line.strip().split(",")
+        interval1 = list(map(int, line[0].split("-")))
+        interval2 = list(map(int, line[1].split("-")))
+        return interval1, interval2
 
     def parse(self, input_file):
         self.data = list()
         with open(input_file, "r") as hand:
             for line in hand:
-                line = line.strip().split(",")
-                interval1 = list(map(int, line[0].split("-")))
-                interval2 = list(map(int, line[1].split("-")))
-                self.data.append((interval1, interval2))
+                self.data.append(self.parseLine(line))
+
+    def getIndex(self):
+        """
+        Index of all the assignments in the file, built on first use.
+        """
+        if self.index is None:
+            self.index = IntervalIndex(interval for pair in self.data for interval in pair)
+        return self.index
+
+    def countOverlapping(self, start, end):
+        return self.getIndex().countOverlapping(start, end)
+
+    def countContained(self, start, end):
+        return self.getIndex().countContained(start, end)
+
+    def countContaining(self, start, end):
+        return self.getIndex().countContaining(start, end)
 
     def solve1(self):
         fully_contained = 0
@@ -41,6 +129,55 @@ class Solver:
                 overlapping += 1
         return overlapping
 
+    def solveStream(self, lines):
+        """
+        Compute both solutions in one pass over the lines of an input.
+        """
+        fully_contained = 0
+        overlapping = 0
+        for line in lines:
+            interval1, interval2 = self.parseLine(line)
+            if contains(interval1, interval2) or contains(interval2, interval1):
+                fully_contained += 1
+            if overlap(interval1, interval2):
+                overlapping += 1
+        return fully_contained, overlapping
+
+
+class NumpySolver(Solver):
+    """
+    Same solutions computed on an array with one row of section ids per line.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.sections = None
+
+    def parse(self, input_file):
+        with open(input_file, "rb") as hand:
+            data = hand.read().translate(bytes.maketrans(b"-,", b"  "))
+        self.sections = np.fromstring(data, dtype=np.int64, sep=" ").reshape(-1, 4)
+
+    def getIndex(self):
+        if self.index is None:
+            self.index = IntervalIndex(self.sections.reshape(-1, 2).tolist())
+        return self.index
+
+    def solve1(self):
+        start1, end1, start2, end2 = self.sections.T
+        first_contained = (start2 <= start1) & (end1 <= end2)
+        second_contained = (start1 <= start2) & (end2 <= end1)
+        return int(np.count_nonzero(first_contained | second_contained))
+
+    def solve2(self):
+        start1, end1, start2, end2 = self.sections.T
+        return int(np.count_nonzero((start1 <= end2) & (start2 <= end1)))
+
+
+BACKENDS = {"python": Solver}
+if np is not None:
+    BACKENDS["numpy"] = NumpySolver
+
 
 if __name__ == "__main__":
     solver = Solver()
@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 import re
-import collections
 MOVE_RE = re.compile("move (\d*) from (\d*) to (\d*)")
 
 class Solver:
@@ -42,7 +41,7 @@ class Solver:
         n_stacks = len(crates.pop())
         self.stacks = []
         for i in range(n_stacks):
-            stack = collections.deque()
+            stack = list()
             for j in range(len(crates), 0, -1):
                 if crates[j-1][i] is None:
                     break
@@ -57,16 +56,25 @@ class Solver:
 
     def apply_move(self, move, current):
         n_el, source, target = move
-        for i in range(n_el):
-            current[target-1].append(current[source-1].pop())
+        if source == target:
+            # Each crate is put back where it was
+            return
+        source_stack = current[source-1]
+        # The crates are moved one at a time, so they end up in reverse order
+        bottom = len(source_stack) - n_el
+        elements = source_stack[bottom:]
+        del source_stack[bottom:]
+        elements.reverse()
+        current[target-1].extend(elements)
 
     def apply_move9001(self, move, current):
         n_el, source, target = move
-        elements = collections.deque()
-        for i in range(n_el):
-            elements.appendleft(current[source-1].pop())
-        for el in elements:
-            current[target-1].append(el)
+        source_stack = current[source-1]
+        bottom = len(source_stack) - n_el
+        # Removed before adding them, the source may also be the target
+        elements = source_stack[bottom:]
+        del source_stack[bottom:]
+        current[target-1].extend(elements)
 
     def solve(self, mover):
         current = self.get_stacks()
@@ -81,6 +89,49 @@ class Solver:
         return self.solve(self.apply_move9001)
 
 
+class BackwardSolver(Solver):
+    """
+    Find the top crates following each final top position back through the moves,
+    without moving any crate.
+    """
+
+    def trace_top(self, reverse):
+        """
+        :param reverse: true if the moved crates end up in reverse order (CrateMover 9000)
+        :return: the top crate of each stack
+        """
+        # Stack and depth from the top of the crate ending on top of each stack
+        stacks = list(range(len(self.stacks)))
+        depths = [0] * len(self.stacks)
+        for n_el, source, target in reversed(self.moves):
+            if source == target:
+                # No crate changes position
+                continue
+            source -= 1
+            target -= 1
+            for i in range(len(stacks)):
+                if stacks[i] == target:
+                    if depths[i] < n_el:
+                        # Moved by this move
+                        stacks[i] = source
+                        if reverse:
+                            depths[i] = n_el - 1 - depths[i]
+                    else:
+                        depths[i] -= n_el
+                elif stacks[i] == source:
+                    depths[i] += n_el
+        return "".join(self.stacks[stack][-1 - depth] for stack, depth in zip(stacks, depths))
+
+    def solve1(self):
+        return self.trace_top(reverse=True)
+
+    def solve2(self):
+        return self.trace_top(reverse=False)
+
+
+BACKENDS = {"python": Solver, "backward": BackwardSolver}
+
+
 if __name__ == "__main__":
     solver = Solver()
     solver.parse("input")
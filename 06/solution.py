@@ -1,5 +1,55 @@
 #!/usr/bin/env python3
-import collections
+import string
+
+
+# Index of each letter in the counts of a window
+LETTERS = bytes.maketrans(string.ascii_lowercase.encode(), bytes(range(26)))
+
+
+def findMarkers(chunks, targets):
+    """
+    Find the first marker of each window size in one pass over consecutive chunks of the datastream.
+    Each window keeps the count of every letter in it and how many letters are repeated,
+    so a character costs O(1) for each window size.
+    :param chunks: iterable of strings
+    :param targets: window sizes
+    :return: list with the number of characters processed when each marker is complete,
+        None if the datastream has no marker of that size
+    """
+    history = max(targets)
+    counts = [[0] * 26 for _ in targets]
+    repeated = [0] * len(targets)
+    markers = [None] * len(targets)
+    # Last characters of the previous chunks, still inside the windows
+    tail = b""
+    position = 0
+    for chunk in chunks:
+        buffer = tail + chunk.strip().encode().translate(LETTERS)
+        offset = len(tail)
+        for j, target in enumerate(targets):
+            if markers[j] is not None:
+                continue
+            count = counts[j]
+            duplicates = repeated[j]
+            for i in range(offset, len(buffer)):
+                ch = buffer[i]
+                if position + i - offset >= target:
+                    prev = buffer[i - target]
+                    count[prev] -= 1
+                    if count[prev] == 1:
+                        duplicates -= 1
+                count[ch] += 1
+                if count[ch] == 2:
+                    duplicates += 1
+                elif duplicates == 0 and position + i - offset + 1 >= target:
+                    markers[j] = position + i - offset + 1
+                    break
+            repeated[j] = duplicates
+        position += len(buffer) - offset
+        tail = buffer[-history:]
+        if None not in markers:
+            break
+    return markers
 
 
 class Solver:
@@ -13,20 +63,7 @@ class Solver:
             self.data = hand.readline().strip()
 
     def solve(self, target):
-        current = collections.defaultdict(int)
-        for i, ch in enumerate(self.data):
-            if i < target:
-                current[ch] += 1
-            else:
-                if max(current.values()) == 1:
-                    break
-                else:
-                    prev = self.data[i-target]
-                    current[prev] -= 1
-                    if current[prev] == 0:
-                        del current[prev]
-                    current[ch] += 1
-        return i
+        return findMarkers([self.data], (target,))[0]
 
     def solve1(self):
         return self.solve(target=4)
@@ -34,6 +71,13 @@ class Solver:
     def solve2(self):
         return self.solve(target=14)
 
+    def solveStream(self, chunks, targets=(4, 14)):
+        """
+        Find the markers in one pass over consecutive chunks of the datastream,
+        keeping only the last characters in memory.
+        """
+        return tuple(findMarkers(chunks, targets))
+
 
 if __name__ == "__main__":
     solver = Solver()
@@ -1,35 +1,191 @@
 #!/usr/bin/env python3
-import collections
+import bisect
+import heapq
 
 
-class TreeNode:
-    def __init__(self, name=None, parent=None):
-        self.name = name
-        self.parent = parent
-        self.files = dict()
-        self.children = dict()
-        self.size = 0
+ROOT = 0
+DISK_SIZE = 70000000
+# Sizes in each block of the size index, blocks are split at twice this
+BLOCK_SIZE = 512
 
-    def addChildren(self, name):
-        if name not in self.children:
-            self.children[name] = TreeNode(name, self)
-        return self.children[name]
 
-    def addFile(self, name, size):
-        if name not in self.files:
-            self.files[name] = size
-            self.updateSize(size)
+class FileSystem:
+    """
+    Folders stored in parallel arrays indexed by folder number,
+    the root being folder 0.
+    A folder is always created after its parent, so iterating the folders
+    backwards visits the children before their parent.
+    Once the sizes are computed, the sizes added by new files are kept pending
+    and applied in place by flush.
+    """
+
+    def __init__(self):
+        self.parents = [None]
+        self.own_sizes = [0]
+        self.sizes = None
+        # Interned names of folders and files
+        self.names = dict()
+        # Child folder by (parent, name id)
+        self.folders = dict()
+        # Files already listed, as (folder, name id)
+        self.files = set()
+        # Size added to each folder and not yet to its total
+        self.pending = dict()
+
+    def __len__(self):
+        return len(self.parents)
+
+    def getNameId(self, name):
+        name_id = self.names.get(name)
+        if name_id is None:
+            name_id = len(self.names)
+            self.names[name] = name_id
+        return name_id
+
+    def getFolder(self, parent, name):
+        return self.folders[(parent, self.getNameId(name))]
+
+    def addFolder(self, parent, name):
+        key = (parent, self.getNameId(name))
+        folder = self.folders.get(key)
+        if folder is None:
+            folder = len(self.parents)
+            self.folders[key] = folder
+            self.parents.append(parent)
+            self.own_sizes.append(0)
+            if self.sizes is not None:
+                self.sizes.append(0)
+        return folder
+
+    def addFile(self, folder, name, size):
+        key = (folder, self.getNameId(name))
+        if key not in self.files:
+            self.files.add(key)
+            self.own_sizes[folder] += size
+            if self.sizes is not None:
+                self.pending[folder] = self.pending.get(folder, 0) + size
+
+    def computeSizes(self):
+        """
+        Total size of each folder, in a single backward pass.
+        """
+        self.sizes = self.own_sizes[:]
+        for folder in range(len(self.parents) - 1, ROOT, -1):
+            self.sizes[self.parents[folder]] += self.sizes[folder]
+        self.pending = dict()
+        return self.sizes
+
+    def flush(self):
+        """
+        Add the pending sizes to the totals of the folders and of their ancestors.
+        Folders are visited from the highest number, so each ancestor
+        is updated once with the sum of the sizes below it.
+        :return: previous size of each updated folder
+        """
+        pending = self.pending
+        old_sizes = dict()
+        border = [-folder for folder in pending]
+        heapq.heapify(border)
+        while len(border) > 0:
+            folder = -heapq.heappop(border)
+            delta = pending.pop(folder)
+            old_sizes[folder] = self.sizes[folder]
+            self.sizes[folder] += delta
+            parent = self.parents[folder]
+            if parent is None:
+                continue
+            if parent in pending:
+                pending[parent] += delta
+            else:
+                pending[parent] = delta
+                heapq.heappush(border, -parent)
+        return old_sizes
+
+
+class SizeIndex:
+    """
+    Folder sizes in increasing order, split in sorted blocks
+    with the total size and the largest size of each block,
+    so that a size can be replaced without sorting all of them again.
+    """
+
+    def __init__(self, sizes):
+        sizes = sorted(sizes)
+        self.blocks = [sizes[i:i + BLOCK_SIZE] for i in range(0, len(sizes), BLOCK_SIZE)]
+        self.totals = [sum(block) for block in self.blocks]
+        self.maxes = [block[-1] for block in self.blocks]
+
+    def add(self, size):
+        # First block with a size of at least size, or the last one
+        i = min(bisect.bisect_left(self.maxes, size), len(self.blocks) - 1)
+        if i < 0:
+            self.blocks.append([size])
+            self.totals.append(size)
+            self.maxes.append(size)
+            return
+        block = self.blocks[i]
+        bisect.insort(block, size)
+        self.totals[i] += size
+        self.maxes[i] = block[-1]
+        if len(block) > 2 * BLOCK_SIZE:
+            # Split the block in halves
+            second = block[BLOCK_SIZE:]
+            del block[BLOCK_SIZE:]
+            self.blocks.insert(i + 1, second)
+            self.totals.insert(i + 1, sum(second))
+            self.totals[i] -= self.totals[i + 1]
+            self.maxes.insert(i + 1, second[-1])
+            self.maxes[i] = block[-1]
+
+    def remove(self, size):
+        i = bisect.bisect_left(self.maxes, size)
+        block = self.blocks[i] if i < len(self.blocks) else []
+        j = bisect.bisect_left(block, size)
+        if j == len(block) or block[j] != size:
+            raise Exception("No folder of size %d" % size)
+        del block[j]
+        if len(block) == 0:
+            del self.blocks[i]
+            del self.totals[i]
+            del self.maxes[i]
+        else:
+            self.totals[i] -= size
+            self.maxes[i] = block[-1]
+
+    def replace(self, old_size, new_size):
+        self.remove(old_size)
+        self.add(new_size)
+
+    def totalBelow(self, limit):
+        """
+        :return: total size of the folders smaller than limit
+        """
+        # The blocks before i only have sizes smaller than limit
+        i = bisect.bisect_left(self.maxes, limit)
+        total = sum(self.totals[:i])
+        if i < len(self.blocks):
+            block = self.blocks[i]
+            total += sum(block[:bisect.bisect_left(block, limit)])
+        return total
+
+    def smallestAtLeast(self, target):
+        """
+        :return: size of the smallest folder of at least target, None if there's none
+        """
+        i = bisect.bisect_left(self.maxes, target)
+        if i == len(self.blocks):
+            return None
+        block = self.blocks[i]
+        return block[bisect.bisect_left(block, target)]
 
-    def updateSize(self, delta):
-        self.size += delta
-        if self.parent is not None:
-            self.parent.updateSize(delta)
 
 class Solver:
 
     def __init__(self):
         self.data = None
-        self.root = None
+        self.filesystem = None
+        self.current = None
+        self.index = None
 
     def parse(self, input_file):
         self.data = list()
@@ -39,58 +195,82 @@ class Solver:
                 self.data.append(line)
         self.populate()
 
-    def populate(self):
-        self.root = TreeNode("/")
-        current = self.root
-        i = 0
-        while i < len(self.data):
-            line = self.data[i]
-            i += 1
+    def applyLine(self, line):
+        """
+        Apply a line of the transcript to the filesystem.
+        The output of ls is every line that is not a command.
+        """
+        if line.startswith("$"):
             command = line[2:]
             if command == "ls":
-                # ls
-                while i < len(self.data) and not self.data[i].startswith("$"):
-                    element = self.data[i]
-                    i += 1
-                    if element.startswith("dir"):
-                        folder_name = element.split(" ", maxsplit=1)[1]
-                        current.addChildren(folder_name)
-                    else:
-                        size_str, name = element.split(" ", maxsplit=1)
-                        current.addFile(name, int(size_str))
+                return
+            folder = command.split(" ", maxsplit=1)[1]
+            if folder == "/":
+                self.current = ROOT
+            elif folder == "..":
+                self.current = self.filesystem.parents[self.current]
             else:
-                # cd
-                folder = command.split(" ")[1]
-                if folder == "/":
-                    current = self.root
-                elif folder == "..":
-                    current = current.parent
-                else:
-                    current = current.children[folder]
-
-    def iterFolders(self):
-        border = collections.deque()
-        border.append(self.root)
-        while len(border) > 0:
-            current = border.pop()
-            yield current
-            for child in current.children.values():
-                border.append(child)
+                self.current = self.filesystem.getFolder(self.current, folder)
+        elif line.startswith("dir"):
+            self.filesystem.addFolder(self.current, line.split(" ", maxsplit=1)[1])
+        else:
+            size_str, name = line.split(" ", maxsplit=1)
+            self.filesystem.addFile(self.current, name, int(size_str))
+
+    def populate(self):
+        self.filesystem = FileSystem()
+        self.current = ROOT
+        for line in self.data:
+            self.applyLine(line)
+        self.index = SizeIndex(self.filesystem.computeSizes())
+
+    def update(self, lines):
+        """
+        Apply lines appended to the transcript, updating the folder sizes in place.
+        Each folder whose total changes is updated once per call,
+        in the sizes and in the size index.
+        """
+        if self.filesystem is None:
+            self.data = list()
+            self.filesystem = FileSystem()
+            self.filesystem.computeSizes()
+            self.current = ROOT
+        n_folders = len(self.filesystem)
+        for line in lines:
+            line = line.strip()
+            if len(line) == 0:
+                continue
+            self.data.append(line)
+            self.applyLine(line)
+        old_sizes = self.filesystem.flush()
+        if self.index is None:
+            return
+        sizes = self.filesystem.sizes
+        for folder, old_size in old_sizes.items():
+            if folder < n_folders:
+                self.index.replace(old_size, sizes[folder])
+        for folder in range(n_folders, len(self.filesystem)):
+            self.index.add(sizes[folder])
+
+    def getIndex(self):
+        if self.index is None:
+            self.index = SizeIndex(self.filesystem.sizes)
+        return self.index
+
+    def totalBelow(self, limit):
+        return self.getIndex().totalBelow(limit)
+
+    def smallestFreeing(self, space_needed, disk_size=DISK_SIZE):
+        """
+        :return: size of the smallest folder to delete to have space_needed free
+        """
+        return self.getIndex().smallestAtLeast(space_needed - (disk_size - self.filesystem.sizes[ROOT]))
 
     def solve1(self):
-        result = 0
-        for current in self.iterFolders():
-            if current.size < 100000:
-                result += current.size
-        return result
+        return self.totalBelow(100000)
 
     def solve2(self):
-        target = 30000000 - (70000000 - self.root.size)
-        result = self.root.size
-        for current in self.iterFolders():
-            if result > current.size >= target:
-                result = current.size
-        return result
+        return self.smallestFreeing(30000000)
 
 
 if __name__ == "__main__":
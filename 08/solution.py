@@ -1,4 +1,59 @@
 #!/usr/bin/env python3
+import array
+import operator
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.grid import Grid, DIGITS
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def getViewingDistances(heights):
+    """
+    :return: for each tree of the line, the number of trees it sees towards the start of the line
+    """
+    distances = [0] * len(heights)
+    # Positions of the trees not yet hidden by a higher one, in decreasing height
+    stack = list()
+    for i, height in enumerate(heights):
+        while len(stack) > 0 and heights[stack[-1]] < height:
+            stack.pop()
+        distances[i] = i - stack[-1] if len(stack) > 0 else i
+        stack.append(i)
+    return distances
+
+
+def iterViews(*arrays):
+    """
+    Yield views of the arrays such that each row is a line of trees
+    looking left, right, up and down in turn.
+    """
+    yield arrays
+    yield tuple(array[:, ::-1] for array in arrays)
+    yield tuple(array.T for array in arrays)
+    yield tuple(array.T[:, ::-1] for array in arrays)
+
+
+def getViewingDistancesArray(heights):
+    """
+    :param heights: 2D array of heights
+    :return: array with the number of trees each tree sees towards the start of its row
+    """
+    dtype = np.int16 if heights.shape[1] < 2 ** 15 else np.int32
+    positions = np.broadcast_to(np.arange(heights.shape[1], dtype=dtype), heights.shape)
+    distances = np.zeros(heights.shape, dtype=dtype)
+    blockers = np.empty(heights.shape, dtype=dtype)
+    for height in range(10):
+        # Position of the last tree at least this high up to each tree, 0 if none
+        np.multiply(positions, heights >= height, out=blockers)
+        np.maximum.accumulate(blockers, axis=1, out=blockers)
+        np.copyto(distances[:, 1:], positions[:, 1:] - blockers[:, :-1], where=heights[:, 1:] == height)
+    return distances
 
 
 class Solver:
@@ -9,81 +64,84 @@ class Solver:
         self.M = -1
 
     def parse(self, input_file):
-        self.grid = list()
         with open(input_file, "r") as hand:
-            for line in hand:
-                self.grid.append(line.strip())
-        self.N = len(self.grid)
-        self.M = len(self.grid[0])
+            lines = [line.strip() for line in hand]
+        self.grid = Grid.fromLines(lines, DIGITS)
+        self.N = self.grid.height
+        self.M = self.grid.width
 
-    def isCorner(self, point):
-        return (point[0] == 0 or point[0] == self.N - 1) and \
-               (point[1] == 0 or point[1] == self.M - 1)
+    def iterLines(self):
+        """
+        Yield the slice of the cells of each row and of each column.
+        """
+        for y in range(self.N):
+            yield slice(y * self.M, (y + 1) * self.M)
+        for x in range(self.M):
+            yield slice(x, self.N * self.M, self.M)
 
-    def rotate(self, point):
-        return point[1], -1 * point[0]
+    def solve1(self):
+        cells = self.grid.cells
+        visible = bytearray(len(cells))
+        for line in self.iterLines():
+            indexes = range(len(cells))[line]
+            highest = max(cells[line])
+            for direction in (indexes, reversed(indexes)):
+                top = -1
+                for index in direction:
+                    height = cells[index]
+                    if height > top:
+                        visible[index] = 1
+                        top = height
+                        # The trees after the highest one are hidden
+                        if top == highest:
+                            break
+        return len(visible) - visible.count(0)
+
+    def solve2(self):
+        cells = self.grid.cells
+        scores = array.array("q", [1]) * len(cells)
+        for line in self.iterLines():
+            heights = cells[line]
+            from_start = getViewingDistances(heights)
+            from_end = getViewingDistances(heights[::-1])
+            from_end.reverse()
+            scores[line] = array.array("q", map(operator.mul, scores[line], map(operator.mul, from_start, from_end)))
+        return max(scores)
+
+class NumpySolver(Solver):
+    """
+    Same solutions computed on the grid as a 2D array,
+    one direction at a time.
+    """
 
-    def lookInside(self, point, look):
-        n_iter = self.N-1 if look[1] == 0 else self.M-1
-        for i in range(1, n_iter):
-            yield point[0] + i * look[0], point[1] + i * look[1]
+    def __init__(self):
+        super().__init__()
+        self.heights = None
 
-    def getTree(self, point):
-        return int(self.grid[point[0]][point[1]])
+    def parse(self, input_file):
+        super().parse(input_file)
+        self.heights = np.frombuffer(self.grid.cells, dtype=np.uint8).reshape(self.N, self.M)
 
     def solve1(self):
-        direction = [0, 1]
-        look = [1, 0]
-        current = (0, 1)
-        visible = set()
-        while current not in visible:
-            visible.add(current)
-            if self.isCorner(current):
-                direction = self.rotate(direction)
-                look = self.rotate(look)
-            else:
-                # Look
-                max_tree_size = self.getTree(current)
-                for point in self.lookInside(current, look):
-                    tree_size = self.getTree(point)
-                    if tree_size > max_tree_size:
-                        visible.add(point)
-                        max_tree_size = tree_size
-            # Next
-            current = (current[0] + direction[0], current[1] + direction[1])
-        return len(visible)
-
-    def lookAlong(self, point, look):
-        n_iter = self.N if look[1] == 0 else self.M
-        for i in range(1, n_iter):
-            candidate_x = point[0] + i * look[0]
-            candidate_y = point[1] + i * look[1]
-            if 0 <= candidate_x < self.N and 0 <= candidate_y < self.M:
-                yield candidate_x, candidate_y
-
-    def getScore(self, point):
-        look = [1, 0]
-        score = 1
-        top_tree = self.getTree(point)
-        for i in range(4):
-            visible = 0
-            for target in self.lookAlong(point, look):
-                current_tree = self.getTree(target)
-                visible += 1
-                if current_tree >= top_tree:
-                    break
-            look = self.rotate(look)
-            score = score * visible
-            if score == 0:
-                break
-        return score
+        visible = np.zeros(self.heights.shape, dtype=bool)
+        for heights, mask in iterViews(self.heights, visible):
+            # Visible if higher than the running maximum of the trees before it
+            highest = np.maximum.accumulate(heights, axis=1)
+            mask[:, 0] = True
+            mask[:, 1:] |= heights[:, 1:] > highest[:, :-1]
+        return int(np.count_nonzero(visible))
 
     def solve2(self):
-        best_score = 0
-        for x in range(1, self.N - 1):
-            for y in range(1, self.M - 1):
-                best_score = max(best_score, self.getScore((x, y)))
-        return best_score
+        scores = np.ones(self.heights.shape, dtype=np.int64)
+        for heights, view in iterViews(self.heights, scores):
+            # Scanning contiguous rows is much faster than scanning the transposed views
+            view *= getViewingDistancesArray(np.ascontiguousarray(heights))
+        return int(scores.max())
+
+
+BACKENDS = {"python": Solver}
+if np is not None:
+    BACKENDS["numpy"] = NumpySolver
 
 
 if __name__ == "__main__":
@@ -1,4 +1,8 @@
 #!/usr/bin/env python3
+from array import array
+import bisect
+import itertools
+import operator
 
 
 MOVE_TO_DELTA = {
@@ -8,63 +12,186 @@ MOVE_TO_DELTA = {
     'D': (0, -1)
 }
 
+# Visited positions are packed as x * STRIDE + y, unique while |y| < STRIDE / 2
+STRIDE = 1 << 32
+# Minimum number of pending positions before merging them
+BATCH_SIZE = 1 << 16
+# Merged positions converted to Python ints at once during a merge
+MERGE_CHUNK = 1 << 16
+
+
+def pack(x, y):
+    return x * STRIDE + y
+
+
+def mergeDistinct(first, second):
+    """
+    :param first: sorted distinct positions
+    :param second: sorted distinct positions
+    :return: sorted distinct positions of both
+    """
+    if len(second) == 0:
+        return first
+    # Sorting two sorted runs is a linear merge
+    merged = sorted(itertools.chain(first, second))
+    # Keep the last of the equal positions, which are adjacent
+    distinct = map(operator.ne, merged, itertools.islice(merged, 1, None))
+    result = array("q", itertools.compress(merged, distinct))
+    result.append(merged[-1])
+    return result
+
+
+class PackedPositions:
+    """
+    Distinct packed positions, kept sorted in an array of 64 bit integers.
+    New positions are appended to a pending array and merged in batches,
+    a batch being at least as large as the positions already merged.
+    """
+
+    def __init__(self, positions=()):
+        self.positions = array("q")
+        self.pending = array("q", positions)
+
+    def __len__(self):
+        self.merge()
+        return len(self.positions)
+
+    def add(self, position):
+        self.pending.append(position)
+
+    def update(self, positions):
+        self.pending.extend(positions)
+
+    def mergeIfFull(self):
+        if len(self.pending) >= max(BATCH_SIZE, len(self.positions)):
+            self.merge()
+
+    def merge(self):
+        """
+        Merge the distinct pending positions into the sorted array,
+        a chunk of it at a time, so that only the pending positions
+        and one chunk are Python ints at any time.
+        """
+        if len(self.pending) == 0:
+            return
+        new_positions = sorted(set(self.pending))
+        self.pending = array("q")
+        positions = self.positions
+        merged = array("q")
+        j = 0
+        for start in range(0, len(positions), MERGE_CHUNK):
+            chunk = positions[start:start + MERGE_CHUNK]
+            # New positions up to the last one of the chunk
+            end = bisect.bisect_right(new_positions, chunk[-1], j)
+            merged.extend(mergeDistinct(chunk, new_positions[j:end]))
+            j = end
+        merged.extend(new_positions[j:])
+        self.positions = merged
+
+
+class Rope:
+    """
+    Knots of a rope, the first one being the head,
+    and the packed positions visited by the tracked knots.
+    """
+
+    def __init__(self, knots, tracked):
+        self.xs = [0] * knots
+        self.ys = [0] * knots
+        self.visited = {knot: PackedPositions((pack(0, 0),)) for knot in tracked}
+
+    def move(self, move, spaces):
+        dx, dy = MOVE_TO_DELTA[move]
+        xs = self.xs
+        ys = self.ys
+        visited = {knot: positions.pending for knot, positions in self.visited.items()}
+        head_visited = visited.get(0)
+        for step in range(1, spaces + 1):
+            xs[0] += dx
+            ys[0] += dy
+            if head_visited is not None:
+                head_visited.append(xs[0] * STRIDE + ys[0])
+            # True while every knot moved exactly as the head
+            straight = True
+            for i in range(1, len(xs)):
+                delta_x = xs[i-1] - xs[i]
+                delta_y = ys[i-1] - ys[i]
+                if -1 <= delta_x <= 1 and -1 <= delta_y <= 1:
+                    # Adiacent, this knot and the following ones do not move
+                    straight = False
+                    break
+                # Sign of the deltas
+                step_x = (delta_x > 0) - (delta_x < 0)
+                step_y = (delta_y > 0) - (delta_y < 0)
+                xs[i] += step_x
+                ys[i] += step_y
+                if step_x != dx or step_y != dy:
+                    straight = False
+                if i in visited:
+                    visited[i].append(xs[i] * STRIDE + ys[i])
+            if straight:
+                # The rope is a straight line behind the head,
+                # so it translates rigidly for the rest of the move
+                self.translate(dx, dy, spaces - step)
+                break
+        for positions in self.visited.values():
+            positions.mergeIfFull()
+
+    def translate(self, dx, dy, spaces):
+        delta = pack(dx, dy)
+        for knot, visited in self.visited.items():
+            position = pack(self.xs[knot], self.ys[knot])
+            visited.update(range(position + delta, position + (spaces + 1) * delta, delta))
+        for i in range(len(self.xs)):
+            self.xs[i] += spaces * dx
+            self.ys[i] += spaces * dy
+
+    def countVisited(self, knot):
+        return len(self.visited[knot])
+
+
 class Solver:
 
     def __init__(self):
         self.moves = None
 
+    def parseLine(self, line):
+        line = line.strip().split(" ")
+        return line[0], int(line[1])
+
     def parse(self, input_file):
         self.moves = list()
         with open(input_file, "r") as hand:
             for line in hand:
-                line = line.strip().split(" ")
-                self.moves.append((line[0], int(line[1])))
-
-    def moveHead(self, point, move):
-        delta = MOVE_TO_DELTA[move]
-        return point[0] + delta[0], point[1] + delta[1]
-
-    def getTailMotionOnAxis(self, direction):
-        if direction == 0:
-            return 0
-        return 1 if direction > 0 else -1
-
-    def moveTail(self, point_tail, point_head):
-        delta_x = point_head[0] - point_tail[0]
-        delta_y = point_head[1] - point_tail[1]
-        if max(abs(delta_x), abs(delta_y)) <= 1:
-            # Adiacent, do not move
-            return point_tail
-        dx = self.getTailMotionOnAxis(delta_x)
-        dy = self.getTailMotionOnAxis(delta_y)
-        return point_tail[0] + dx, point_tail[1] + dy
+                self.moves.append(self.parseLine(line))
 
-    def solve1(self):
-        head = (0, 0)
-        tail = (0, 0)
-        visited = set()
-        visited.add(tail)
+    def countTailPositions(self, knots):
+        """
+        :return: number of positions visited by the tail of a rope with the given knots
+        """
+        rope = Rope(knots, tracked=(knots - 1,))
         for move, spaces in self.moves:
-            for _ in range(spaces):
-                head = self.moveHead(head, move)
-                tail = self.moveTail(tail, head)
-                visited.add(tail)
-        return len(visited)
+            rope.move(move, spaces)
+        return rope.countVisited(knots - 1)
+
+    def solve1(self):
+        return self.countTailPositions(2)
 
     def solve2(self):
-        head = (0, 0)
-        nodes = [(0, 0) for _ in range(9)]
-        visited = set()
-        visited.add(nodes[-1])
-        for move, spaces in self.moves:
-            for _ in range(spaces):
-                head = self.moveHead(head, move)
-                prev = head
-                for i in range(9):
-                    nodes[i] = self.moveTail(nodes[i], prev)
-                    prev = nodes[i]
-                visited.add(nodes[-1])
-        return len(visited)
+        return self.countTailPositions(10)
+
+    def solveStream(self, lines):
+        """
+        Compute both solutions in one pass over the lines of an input.
+        The tail of the short rope follows the same path as the first knot
+        of the long one, so a single rope is simulated.
+        Memory is bounded by the visited positions, not by the number of moves.
+        """
+        rope = Rope(10, tracked=(1, 9))
+        for line in lines:
+            move, spaces = self.parseLine(line)
+            rope.move(move, spaces)
+        return rope.countVisited(1), rope.countVisited(9)
 
 
 if __name__ == "__main__":
@@ -1,42 +1,68 @@
 #!/usr/bin/env python3
+import array
+import itertools
+
+
+def iterCycles(instructions):
+    cycle = 1
+    x = 1
+    for instruction in instructions:
+        yield cycle, x
+        if instruction == "noop":
+            cycle += 1
+        else:
+            _, qty = instruction.split(" ")
+            qty = int(qty)
+            yield cycle+1, x
+            x += qty
+            cycle += 2
+    yield cycle, x
+
+
+def compileTrace(instructions):
+    """
+    :return: array with the value of X during each cycle, from cycle 1,
+        followed by its value at the end of the program
+    """
+    # Change of X at the end of each cycle
+    deltas = list()
+    for instruction in instructions:
+        deltas.append(0)
+        if instruction != "noop":
+            # addx takes a second cycle, at the end of which X changes
+            deltas.append(int(instruction[5:]))
+    return array.array("q", itertools.accumulate(deltas, initial=1))
 
 
 class Solver:
 
     def __init__(self):
-        self.instructions = None
+        self.trace = None
 
     def parse(self, input_file):
-        self.instructions = list()
         with open(input_file, "r") as hand:
-            for line in hand:
-                self.instructions.append(line.strip())
-
-    def executeCycles(self):
-        cycle = 1
-        x = 1
-        for instruction in self.instructions:
-            yield cycle, x
-            if instruction == "noop":
-                cycle += 1
-            else:
-                _, qty = instruction.split(" ")
-                qty = int(qty)
-                yield cycle+1, x
-                x += qty
-                cycle += 2
-        yield cycle, x
+            self.trace = compileTrace(line.strip() for line in hand)
 
-    def solve1(self):
+    def getX(self, cycle):
+        if cycle < 1:
+            raise Exception("Invalid cycle %d, cycles start at 1" % cycle)
+        return self.trace[cycle - 1]
+
+    def getSignalStrength(self, cycles):
+        """
+        :return: sum of the signal strengths during the given cycles, skipping the ones after the program
+        """
         result = 0
-        next_target = 20
-        for cycle, x in self.executeCycles():
-            if cycle == next_target:
-                result += x * cycle
-                if next_target < 220:
-                    next_target += 40
+        for cycle in cycles:
+            if cycle < 1:
+                raise Exception("Invalid cycle %d, cycles start at 1" % cycle)
+            if cycle <= len(self.trace):
+                result += cycle * self.trace[cycle - 1]
         return result
 
+    def solve1(self):
+        return self.getSignalStrength(range(20, 221, 40))
+
     def printCrt(self, crt):
         res = list()
         for i in range(6):
@@ -45,13 +71,29 @@ class Solver:
 
     def solve2(self):
         crt = ["."] * (40*6)
-        for cycle, x in self.executeCycles():
-            crt_pos = cycle-1
-            hor_pos = crt_pos % 40
-            if x - 1 <= hor_pos <= x + 1:
+        for crt_pos in range(min(len(crt), len(self.trace))):
+            x = self.trace[crt_pos]
+            if x - 1 <= crt_pos % 40 <= x + 1:
                 crt[crt_pos] = "#"
         return crt
 
+    def solveStream(self, lines):
+        """
+        Compute both solutions in one pass over the lines of an input.
+        """
+        result = 0
+        next_target = 20
+        crt = ["."] * (40*6)
+        for cycle, x in iterCycles(line.strip() for line in lines):
+            if cycle == next_target:
+                result += x * cycle
+                if next_target < 220:
+                    next_target += 40
+            crt_pos = cycle-1
+            if crt_pos < len(crt) and x - 1 <= crt_pos % 40 <= x + 1:
+                crt[crt_pos] = "#"
+        return result, crt
+
 
 if __name__ == "__main__":
     solver = Solver()
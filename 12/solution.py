@@ -1,5 +1,14 @@
 #!/usr/bin/env python3
 import heapq
+import os
+import string
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.grid import Grid, makeTable
+
+
+HEIGHTS = makeTable(dict({ch: i for i, ch in enumerate(string.ascii_lowercase)}, S=0, E=25))
 
 class Solver:
 
@@ -10,47 +19,34 @@ class Solver:
         self.start = None
         self.end = None
         self.startIsMarked = True
+        self.metrics = None
 
     def parse(self, input_file):
-        self.heightmap = list()
         with open(input_file, "r") as hand:
-            for x, line in enumerate(hand):
-                line = line.strip()
-                self.heightmap.append(line)
-                s_idx = line.find('S')
-                if s_idx > -1:
-                    self.start = (x, s_idx)
-                e_idx = line.find('E')
-                if e_idx > -1:
-                    self.end = (x, e_idx)
-        self.N = len(self.heightmap)
-        self.M = len(self.heightmap[0])
+            lines = [line.strip() for line in hand]
+        # Points are packed indexes in the heightmap
+        self.heightmap = Grid.fromLines(lines, HEIGHTS)
+        for x, line in enumerate(lines):
+            s_idx = line.find('S')
+            if s_idx > -1:
+                self.start = self.heightmap.index(s_idx, x)
+            e_idx = line.find('E')
+            if e_idx > -1:
+                self.end = self.heightmap.index(e_idx, x)
+        self.N = self.heightmap.height
+        self.M = self.heightmap.width
 
     def iterNeighbours(self, point):
-        x, y = point
-        if x > 0:
-            yield x - 1, y
-        if x < self.N - 1:
-            yield x + 1, y
-        if y > 0:
-            yield x, y - 1
-        if y < self.M - 1:
-            yield x, y + 1
+        return self.heightmap.iterNeighbours(point)
 
     def getHeight(self, point):
-        x, y = point
-        ch = self.heightmap[x][y]
-        if ch == 'S':
-            ch = 'a'
-        elif ch == 'E':
-            ch = 'z'
-        return ord(ch) - ord('a')
+        return self.heightmap.cells[point]
 
     def isPossibleStartPoint(self, point):
         if self.startIsMarked:
-            return point[0] == self.start[0] and point[1] == self.start[1]
+            return point == self.start
         else:
-            return self.getHeight(point) == 0
+            return self.heightmap.cells[point] == 0
 
     def solve1(self):
         self.startIsMarked = True
@@ -66,13 +62,19 @@ class Solver:
         heapq.heapify(border)
         heapq.heappush(border, (0, self.end))
         explored.add(self.end)
+        if self.metrics is not None:
+            self.metrics.push(len(border))
         solution = -1
         while len(border) > 0 and solution == -1:
             current_steps, current_point = heapq.heappop(border)
+            if self.metrics is not None:
+                self.metrics.pop()
             current_height = self.getHeight(current_point)
             for neighbour_point in self.iterNeighbours(current_point):
                 neighbour_height = self.getHeight(neighbour_point)
                 if neighbour_point in explored:
+                    if self.metrics is not None:
+                        self.metrics.deduplicate()
                     continue
                 if neighbour_height >= current_height - 1:
                     if self.isPossibleStartPoint(neighbour_point):
@@ -80,6 +82,8 @@ class Solver:
                         break
                     heapq.heappush(border, (current_steps + 1, neighbour_point))
                     explored.add(neighbour_point)
+                    if self.metrics is not None:
+                        self.metrics.push(len(border))
         return solution
 
 
@@ -58,8 +58,7 @@ class Solver:
         intersections.sort(key=lambda el: el[0])
         return intersections
 
-    def solve1(self):
-        row = 2000000
+    def countCoveredOnRow(self, row):
         empty_beacons = self.computeIntersectionsWithRow(row)
         tot_size = 0
         max_x = None
@@ -76,6 +75,9 @@ class Solver:
             tot_size += size
         return tot_size
 
+    def solve1(self):
+        return self.countCoveredOnRow(2000000)
+
     def _scanRow(self, row):
         all_intersect = self.computeIntersectionsWithRow(row)
         max_x = -1
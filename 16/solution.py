@@ -4,8 +4,9 @@ import collections
 
 
 class BaseStatusQueue:
-    def __init__(self, valve_to_flow):
+    def __init__(self, valve_to_flow, metrics=None):
         self.valve_to_flow = valve_to_flow
+        self.metrics = metrics
         self.heap = list()
         heapq.heapify(self.heap)
         self.valve_to_idx = dict()
@@ -17,6 +18,14 @@ class BaseStatusQueue:
     def isEmpty(self):
         return len(self.heap) == 0
 
+    def _recordPush(self):
+        if self.metrics is not None:
+            self.metrics.push(len(self.heap))
+
+    def _recordPop(self):
+        if self.metrics is not None:
+            self.metrics.pop()
+
 
 class StatusQueue(BaseStatusQueue):
 
@@ -38,9 +47,11 @@ class StatusQueue(BaseStatusQueue):
     def push(self, valve, rem_time, current_flux, opened, valve_stack):
         prio = self._get_priority(valve, rem_time, current_flux, opened)
         heapq.heappush(self.heap, (prio, valve, rem_time, current_flux, opened.copy(), valve_stack.copy()))
+        self._recordPush()
 
     def pop(self):
         (extimate, valve, rem_time, current_flux, opened, valve_stack) = heapq.heappop(self.heap)
+        self._recordPop()
         return -1 * extimate, valve, rem_time, current_flux, opened, valve_stack
 
 
@@ -75,9 +86,11 @@ class StatusQueueEl(BaseStatusQueue):
     def push(self, position_me, position_el, current_flux, opened, claimed, valve_stack):
         prio = self._get_priority(None, max(position_me[1], position_el[1]), current_flux, opened)
         heapq.heappush(self.heap, (prio, position_me, position_el, current_flux, opened.copy(), claimed.copy(), valve_stack.copy()))
+        self._recordPush()
 
     def pop(self):
         (extimate, position_me, position_el, current_flux, opened, claimed, valve_stack) = heapq.heappop(self.heap)
+        self._recordPop()
         return -1 * extimate, position_me, position_el, current_flux, opened, claimed, valve_stack
 
     def isEmpty(self):
@@ -90,6 +103,7 @@ class Solver:
         self.paths = None
         self.valves = None
         self.min_distance = None
+        self.metrics = None
 
     def parse(self, input_file):
         self.paths = dict()
@@ -124,7 +138,7 @@ class Solver:
 
     def solve1(self):
         best_output = 0
-        status_queue = StatusQueue(self.valves)
+        status_queue = StatusQueue(self.valves, self.metrics)
         opened = set()
         to_be_opened = 0
         for valve, flow in self.valves.items():
@@ -134,6 +148,8 @@ class Solver:
         while not status_queue.isEmpty():
             (extimate, valve, rem_time, current_flux, opened, valve_stack) = status_queue.pop()
             if extimate <= best_output:
+                if self.metrics is not None:
+                    self.metrics.prune()
                 continue
             if valve not in opened and self.valves[valve] > 0 and rem_time > 1:
                 opened.add(valve)
@@ -150,7 +166,7 @@ class Solver:
 
     def solve2(self):
         best_output = 0
-        status_queue = StatusQueueEl(self.valves)
+        status_queue = StatusQueueEl(self.valves, self.metrics)
         to_be_opened = 0
         for valve, flow in self.valves.items():
             if flow > 0:
@@ -168,6 +184,8 @@ class Solver:
         while not status_queue.isEmpty():
             (extimate, position_me, position_el, current_flux, opened, claimed, valve_stack) = status_queue.pop()
             if extimate <= best_output:
+                if self.metrics is not None:
+                    self.metrics.prune()
                 continue
             move_me = True if position_me[1] >= position_el[1] else False
             valve = position_me[0] if move_me else position_el[0]
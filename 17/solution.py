@@ -1,4 +1,9 @@
 #!/usr/bin/env python3
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.grid import Grid
 
 
 class Rock:
@@ -86,7 +91,7 @@ class SquareRock(Rock):
 class Space:
 
     def __init__(self):
-        self.board = []
+        self.board = Grid(7, 0)
         self.levels = []
 
     def isOccupied(self, x, y):
@@ -94,19 +99,16 @@ class Space:
             return True
         if x < 0 or x > 6:
             return True
-        if y >= len(self.board):
+        if y >= self.board.height:
             return False
-        return self.board[y][x]
+        return self.board.cells[y * 7 + x] == 1
 
     def add(self, x, y):
-        while y >= len(self.board):
-            self.board.append([False]*7)
-            self.levels.append(0)
-        self.board[y][x] = True
-        self.levels[y] = 0
-        for i, el in enumerate(self.board[y]):
-            if el:
-                self.levels[y] += 2**i
+        if y >= self.board.height:
+            self.levels.extend([0] * (y + 1 - self.board.height))
+            self.board.addRows(y + 1 - self.board.height)
+        self.board.cells[y * 7 + x] = 1
+        self.levels[y] |= 1 << x
 
     def getLevel(self, y):
         if y >= len(self.levels):
@@ -114,14 +116,10 @@ class Space:
         return self.levels[y]
 
     def getMaxHeight(self):
-        return len(self.board)
+        return self.board.height
 
     def print(self):
-        res = ""
-        for i in range(len(self.board), 0, -1):
-            line = self.board[i - 1]
-            res = res + "\n" + "".join(map(lambda el: "#" if el else " ", line))
-        print(res)
+        print("\n" + "\n".join(reversed(self.board.toLines(" #"))))
 
 
 class Board:
@@ -176,7 +174,9 @@ class Solver:
         rocks = board.iterRocks()
         moves = self.iterMoves()
         fallen_rocks = 0
-        delta_size = None
+        # Height of the repeated cycles skipped, once a cycle is found
+        delta_size = 0
+        cycle_found = False
         while fallen_rocks < iterations:
             rock = next(rocks)
             first_move, move = next(moves)
@@ -188,7 +188,8 @@ class Solver:
             for x, y in rock.getSpaces():
                 board.addTile(x, y, rock, first_move, fallen_rocks)
             prev_lvl, prev_fallen = board.findPrevious(rock, first_move)
-            if delta_size is None and prev_lvl > -1:
+            if not cycle_found and prev_lvl > -1:
+                cycle_found = True
                 repeat_size = rock.height - prev_lvl
                 repeat_n_rocks = fallen_rocks - prev_fallen
                 repeats = (iterations - fallen_rocks) // repeat_n_rocks
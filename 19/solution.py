@@ -15,8 +15,9 @@ ROBOT_GEODE = 3
 
 
 class StatusQueue:
-    def __init__(self):
+    def __init__(self, metrics=None):
         self.queue = []
+        self.metrics = metrics
         heapq.heapify(self.queue)
 
     def prioritize(self, estimate, robots, resources, rem_time):
@@ -31,9 +32,13 @@ class StatusQueue:
         robots, resources, rem_time = status
         priority = self.prioritize(estimate, robots, resources, rem_time)
         heapq.heappush(self.queue, (priority, estimate, status))
+        if self.metrics is not None:
+            self.metrics.push(len(self.queue))
 
     def pop(self):
         _, estimate, status = heapq.heappop(self.queue)
+        if self.metrics is not None:
+            self.metrics.pop()
         return estimate, status
 
     def isEmpty(self):
@@ -42,8 +47,9 @@ class StatusQueue:
 
 class GeodesSolver:
 
-    def __init__(self, blueprint):
+    def __init__(self, blueprint, metrics=None):
         self.blueprint = blueprint
+        self.metrics = metrics
         self.max_robots_per_type = [0] * 4
         for robot in range(4):
             requirements = self._getRequirements(robot)
@@ -134,7 +140,7 @@ class GeodesSolver:
         return tuple(new_resources)
 
     def solve(self, time):
-        queue = StatusQueue()
+        queue = StatusQueue(self.metrics)
         init_status = ((1, 0, 0, 0), (0, 0, 0, 0), time)
         estimate = self.estimate(*init_status)
         queue.add(estimate, init_status)
@@ -143,10 +149,14 @@ class GeodesSolver:
         while not queue.isEmpty():
             estimate, status = queue.pop()
             if status in explored:
+                if self.metrics is not None:
+                    self.metrics.deduplicate()
                 continue
             explored.add(status)
             robots, resources, rem_time = status
             if estimate <= best_result:
+                if self.metrics is not None:
+                    self.metrics.prune()
                 continue
             best_result = max(best_result, resources[-1])
             build_construct = False
@@ -170,6 +180,7 @@ class Solver:
 
     def __init__(self):
         self.blueprints = None
+        self.metrics = None
 
     def parse(self, input_file):
         self.blueprints = list()
@@ -191,7 +202,7 @@ class Solver:
                 self.blueprints.append(blueprint)
 
     def test(self, blueprint, time):
-        gsolver = GeodesSolver(blueprint)
+        gsolver = GeodesSolver(blueprint, self.metrics)
         return gsolver.solve(time)
 
     def solve1(self):
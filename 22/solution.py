@@ -1,4 +1,9 @@
 #!/usr/bin/env python3
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.grid import Grid, makeTable
 
 
 TURN_LEFT = "L"
@@ -6,6 +11,11 @@ TURN_RIGHT = "R"
 
 TILE_WALL = "#"
 
+CELL_VOID = 0
+CELL_OPEN = 1
+CELL_WALL = 2
+CELLS = makeTable({".": CELL_OPEN, TILE_WALL: CELL_WALL})
+
 FACE_UP = (0, -1)
 FACE_DOWN = (0, 1)
 FACE_RIGHT = (1, 0)
@@ -94,8 +104,9 @@ def convert_rows_to_string(rows, point, icon):
 
 class Plane(Space):
 
-    def __init__(self, rows):
+    def __init__(self, rows, grid):
         self.rows = rows
+        self.grid = grid
         self.position = (0, 0)
         self.direction = (1, 0)
 
@@ -132,7 +143,7 @@ class Plane(Space):
             new_x = x + current_delta - new_delta
             if 0 <= new_x < len(new_row):
                 break
-        if new_row[new_x] == TILE_WALL:
+        if self.grid.cells[new_y * self.grid.width + new_delta + new_x] == CELL_WALL:
             return False
         else:
             self.position = (new_x, new_y)
@@ -146,9 +157,9 @@ class Plane(Space):
         :return:
         """
         x, y = self.position
-        _, row = self.rows[y]
+        delta, row = self.rows[y]
         new_x = (x + dx) % len(row)
-        if row[new_x] == TILE_WALL:
+        if self.grid.cells[y * self.grid.width + delta + new_x] == CELL_WALL:
             return False
         else:
             self.position = (new_x, y)
@@ -316,6 +327,7 @@ class Solver:
 
     def __init__(self):
         self.rows = None
+        self.grid = None
         self.instructions = None
 
     def parse(self, input_file):
@@ -346,6 +358,7 @@ class Solver:
                         else:
                             break
                     self.rows.append((delta, line))
+        self.grid = Grid.fromLines([" " * delta + row for delta, row in self.rows], CELLS)
 
     def run(self, space):
         for instruction in self.instructions:
@@ -362,7 +375,7 @@ class Solver:
         return 1000 * (row + 1) + 4 * (col + 1) + facingToScore(direction)
 
     def solve1(self):
-        plane = Plane(self.rows)
+        plane = Plane(self.rows, self.grid)
         return self.run(plane)
 
     def solve2(self):
@@ -1,4 +1,9 @@
 #!/usr/bin/env python3
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.grid import Grid
 
 
 DIRECTIONS = [
@@ -19,17 +24,97 @@ def iterNeighbours(x, y):
     yield x + 1, y + 1
 
 
-def vectorSum(a, b):
-    res = [0] * len(a)
-    for i in range(len(a)):
-        res[i] = a[i] + b[i]
-    return tuple(res)
-
+class Grove:
+    """
+    Elves on a grid with a free margin all around.
+    Elves move at most one tile per round, so the grid is rebuilt
+    around them before any elf can reach the border.
+    """
+    MARGIN = 10
 
-def iterDirections(x, y, iter_number):
-    for i in range(4):
-        direction = DIRECTIONS[(iter_number + i) % 4]
-        yield tuple(map(lambda el: vectorSum((x, y), el), direction))
+    def __init__(self, positions):
+        self.grid = None
+        self.elfs = None
+        self.min_x = 0
+        self.min_y = 0
+        self.neighbours = None
+        self.directions = None
+        self.rounds_left = 0
+        self._build(positions)
+
+    def _build(self, positions):
+        (min_x, min_y), (max_x, max_y) = getSquareSize(positions)
+        self.min_x = min_x - Grove.MARGIN
+        self.min_y = min_y - Grove.MARGIN
+        width = max_x - min_x + 1 + 2 * Grove.MARGIN
+        height = max_y - min_y + 1 + 2 * Grove.MARGIN
+        self.grid = Grid(width, height)
+        self.elfs = set()
+        for x, y in positions:
+            elf = self.grid.index(x - self.min_x, y - self.min_y)
+            self.grid[elf] = 1
+            self.elfs.add(elf)
+        self.neighbours = [dy * width + dx for dx, dy in iterNeighbours(0, 0)]
+        self.directions = [tuple(dy * width + dx for dx, dy in direction) for direction in DIRECTIONS]
+        self.rounds_left = Grove.MARGIN - 1
+
+    def getPositions(self):
+        positions = list()
+        for elf in self.elfs:
+            x, y = self.grid.unpack(elf)
+            positions.append((x + self.min_x, y + self.min_y))
+        return positions
+
+    def getProposedMove(self, elf, iter_number):
+        cells = self.grid.cells
+        for delta in self.neighbours:
+            if cells[elf + delta]:
+                break
+        else:
+            return None
+        for i in range(4):
+            candidate, check1, check2, check3 = self.directions[(iter_number + i) % 4]
+            if cells[elf + check1] or cells[elf + check2] or cells[elf + check3]:
+                continue
+            return elf + candidate
+        return None
+
+    def iterOnce(self, iter_number):
+        if self.rounds_left == 0:
+            self._build(self.getPositions())
+        self.rounds_left -= 1
+        # Proposed position to the elf moving there, None if more elfs propose it
+        proposed_moves = dict()
+        for elf in self.elfs:
+            position = self.getProposedMove(elf, iter_number)
+            if position is None:
+                continue
+            proposed_moves[position] = None if position in proposed_moves else elf
+        if len(proposed_moves) == 0:
+            return False
+        # The proposed positions are free, so the elfs can be moved in place
+        for new_position, elf in proposed_moves.items():
+            if elf is not None:
+                self.grid[elf] = 0
+                self.grid[new_position] = 1
+                self.elfs.remove(elf)
+                self.elfs.add(new_position)
+        return True
+
+
+def getSquareSize(positions):
+    min_x, max_x = None, 0
+    min_y, max_y = None, 0
+    for x, y in positions:
+        if min_x is None:
+            min_x = x
+        if min_y is None:
+            min_y = y
+        min_x = min(min_x, x)
+        min_y = min(min_y, y)
+        max_x = max(max_x, x)
+        max_y = max(max_y, y)
+    return (min_x, min_y), (max_x, max_y)
 
 
 class Solver:
@@ -46,36 +131,8 @@ class Solver:
                     if ch == "#":
                         self.elfs.add((x, y))
 
-    def getProposedMove(self, elf, positions, iter_number):
-        x, y = elf
-        moves = False
-        for nx, ny in iterNeighbours(x, y):
-            if (nx, ny) in positions:
-                moves = True
-                break
-        if not moves:
-            return None
-        for candidate, check1, check2, check3 in iterDirections(x, y, iter_number):
-            if check1 in positions or check2 in positions or check3 in positions:
-                continue
-            return candidate
-
-    def getSquareSize(self, positions):
-        min_x, max_x = None, 0
-        min_y, max_y = None, 0
-        for x, y in positions:
-            if min_x is None:
-                min_x = x
-            if min_y is None:
-                min_y = y
-            min_x = min(min_x, x)
-            min_y = min(min_y, y)
-            max_x = max(max_x, x)
-            max_y = max(max_y, y)
-        return (min_x, min_y), (max_x, max_y)
-
     def printPositions(self, positions):
-        (min_x, min_y), (max_x, max_y) = self.getSquareSize(positions)
+        (min_x, min_y), (max_x, max_y) = getSquareSize(positions)
         width = max_x - min_x + 1
         height = max_y - min_y + 1
         result = [None] * height
@@ -90,41 +147,20 @@ class Solver:
         table = "\n".join(result)
         print(table)
 
-    def iterOnce(self, current_positions, iter_number):
-        proposed_moves = dict()
-        new_positions = set()
-        for elf in current_positions:
-            position = self.getProposedMove(elf, current_positions, iter_number)
-            if position is None:  # 861 is too low
-                new_positions.add(elf)
-                continue
-            if position not in proposed_moves:
-                proposed_moves[position] = set()
-            proposed_moves[position].add(elf)
-        iter_number += 1
-        if len(proposed_moves) == 0:
-            return False, current_positions
-        for new_position, current_elfs in proposed_moves.items():
-            if len(current_elfs) == 1:
-                new_positions.add(new_position)
-            else:
-                for elf in current_elfs:
-                    new_positions.add(elf)
-        return True, new_positions
-
     def solve1(self):
-        current_positions = self.elfs.copy()
+        grove = Grove(self.elfs)
         for iter_number in range(10):
-            _, current_positions = self.iterOnce(current_positions, iter_number)
-        (min_x, min_y), (max_x, max_y) = self.getSquareSize(current_positions)
+            grove.iterOnce(iter_number)
+        current_positions = grove.getPositions()
+        (min_x, min_y), (max_x, max_y) = getSquareSize(current_positions)
         return (max_x - min_x + 1) * (max_y - min_y + 1) - len(current_positions)
 
     def solve2(self):
-        current_positions = self.elfs.copy()
+        grove = Grove(self.elfs)
         iter_number = 0
         elfs_move = True
         while elfs_move:
-            elfs_move, current_positions = self.iterOnce(current_positions, iter_number)
+            elfs_move = grove.iterOnce(iter_number)
             iter_number += 1
         return iter_number
 
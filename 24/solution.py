@@ -1,6 +1,11 @@
 #!/usr/bin/env python3
 import math
 import heapq
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.grid import Grid
 
 
 MOVEMENTS = {
@@ -20,22 +25,20 @@ class Valley:
         self.blizzards = blizzards
 
     def updateBlizzards(self):
-        new_blizzards = dict()
-        for (x, y), directions in self.blizzards.items():
-            for direction in directions:
-                dx, dy = MOVEMENTS[direction]
-                nx = (x + dx) % self.width
-                ny = (y + dy) % self.height
-                if (nx, ny) not in new_blizzards:
-                    new_blizzards[(nx, ny)] = list()
-                new_blizzards[(nx, ny)].append(direction)
+        new_blizzards = list()
+        for x, y, direction in self.blizzards:
+            dx, dy = MOVEMENTS[direction]
+            new_blizzards.append(((x + dx) % self.width, (y + dy) % self.height, direction))
         self.blizzards = new_blizzards
 
     def getFreeSpaces(self):
-        for y in range(self.height):
-            for x in range(self.width):
-                if (x, y) not in self.blizzards:
-                    yield x, y
+        """
+        Return a grid with 1 on the tiles without blizzards.
+        """
+        free_spaces = Grid(self.width, self.height, fill=1)
+        for x, y, _ in self.blizzards:
+            free_spaces.cells[y * self.width + x] = 0
+        return free_spaces
 
     def getNeighbours(self, x, y):
         yield x, y
@@ -49,14 +52,10 @@ class Valley:
             yield x, y + 1
 
     def __str__(self):
-        result = list()
-        for y in range(self.height):
-            row = ["."] * self.width
-            for x in range(self.width):
-                if (x, y) in self.blizzards:
-                    row[x] = self.blizzards[(x, y)][0]
-            result.append("".join(row))
-        return "\n".join(result)
+        result = [["."] * self.width for _ in range(self.height)]
+        for x, y, direction in self.blizzards:
+            result[y][x] = direction
+        return "\n".join("".join(row) for row in result)
 
 
 class ValleyStatus:
@@ -67,9 +66,7 @@ class ValleyStatus:
 
     def load(self):
         for i in range(self.valley.period):
-            self.free_spaces_per_turn[i] = set()
-            for x, y in self.valley.getFreeSpaces():
-                self.free_spaces_per_turn[i].add((x, y))
+            self.free_spaces_per_turn[i] = self.valley.getFreeSpaces()
             self.valley.updateBlizzards()
 
     def getFreePoints(self, turn):
@@ -78,8 +75,9 @@ class ValleyStatus:
 
 class StatusQueue:
 
-    def __init__(self, target):
+    def __init__(self, target, metrics=None):
         self.tx, self.ty = target
+        self.metrics = metrics
         self.queue = list()
         heapq.heapify(self.queue)
 
@@ -89,9 +87,13 @@ class StatusQueue:
     def add(self, x, y, turn):
         estimate = self._estimate(x, y, turn)
         heapq.heappush(self.queue, (estimate, turn, x, y))
+        if self.metrics is not None:
+            self.metrics.push(len(self.queue))
 
     def pop(self):
         estimate, turn, x, y = heapq.heappop(self.queue)
+        if self.metrics is not None:
+            self.metrics.pop()
         return estimate, x, y, turn
 
     def isEmpty(self):
@@ -108,9 +110,10 @@ class Solver:
         self.target = None
         self.valley = None
         self.valley_status = None
+        self.metrics = None
 
     def parse(self, input_file):
-        self.blizzards = dict()
+        self.blizzards = list()
         with open(input_file, "r") as hand:
             self.height = 0
             for line in hand:
@@ -120,7 +123,7 @@ class Solver:
                 space = line[1:-1]
                 for x, ch in enumerate(space):
                     if ch != ".":
-                        self.blizzards[(x, self.height)] = [ch]
+                        self.blizzards.append((x, self.height, ch))
                 self.height += 1
                 self.width = len(line) - 2
         self.valley = Valley(self.width, self.height, self.blizzards)
@@ -128,26 +131,30 @@ class Solver:
         self.valley_status.load()
 
     def run(self, start, starting_turn, target):
-        statuses = StatusQueue(target)
+        statuses = StatusQueue(target, self.metrics)
         for wait_time in range(self.valley.period):
             turn = starting_turn + wait_time
             free_points = self.valley_status.getFreePoints(turn)
-            if start in free_points:
+            if free_points.get(*start):
                 statuses.add(*start, turn)
         best_result = -1
         explored = set()
         while not statuses.isEmpty():
             estimate, x, y, turn = statuses.pop()
             if (x, y, turn) in explored:
+                if self.metrics is not None:
+                    self.metrics.deduplicate()
                 continue
             if estimate >= best_result > -1:
+                if self.metrics is not None:
+                    self.metrics.prune()
                 continue
             if (x, y) == target:
                 best_result = turn
                 continue
-            free_points = self.valley_status.getFreePoints(turn + 1)
+            free_points = self.valley_status.getFreePoints(turn + 1).cells
             for nx, ny in self.valley.getNeighbours(x, y):
-                if (nx, ny) in free_points:
+                if free_points[ny * self.width + nx]:
                     statuses.add(nx, ny, turn + 1)
             explored.add((x, y, turn))
         return best_result + 1
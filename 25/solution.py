@@ -71,6 +71,15 @@ class Solver:
             total += fromSnafu(value)
         return toSnafu(total)
 
+    def solveStream(self, lines):
+        """
+        Compute the solution in one pass over the lines of an input.
+        """
+        total = 0
+        for line in lines:
+            total += fromSnafu(line.strip())
+        return toSnafu(total),
+
 
 if __name__ == "__main__":
     solver = Solver()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+import argparse
+import contextlib
+import json
+import os
+import statistics
+import sys
+import time
+
+from aoc import cache
+from aoc import days
+from aoc import history
+from aoc.metrics import SearchMetrics
+from aoc.profiling import Instrumentation
+
+
+def timeCall(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def summarize(samples):
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "runs": len(samples)
+    }
+
+
+class DayBenchmark:
+
+    def __init__(self, day, input_path, warmup=1, repeat=5, quiet=True, use_cache=False,
+                 instrumentation=None, report_dir=None, search_metrics=False):
+        self.day = day
+        self.input_path = input_path
+        self.warmup = warmup
+        self.repeat = repeat
+        self.quiet = quiet
+        self.use_cache = use_cache
+        self.instrumentation = instrumentation
+        self.report_dir = report_dir
+        self.search_metrics = search_metrics
+        self.solver_class = days.loadSolver(day)
+        self.parts = days.getParts(self.solver_class)
+
+    def runPhase(self, solver, phase):
+        if phase == "parse":
+            if self.use_cache:
+                return timeCall(cache.parse, self.day, solver, self.input_path)
+            return timeCall(solver.parse, self.input_path)
+        return timeCall(getattr(solver, phase))
+
+    def runOnce(self):
+        """
+        Run parse and every part on a fresh solver.
+        Some parts reuse the state left by the previous one,
+        so the parts are always executed in order.
+        :return: the solver, the answers and the time of each phase
+        """
+        solver = self.solver_class()
+        timings = dict()
+        answers = dict()
+        _, timings["parse"] = self.runPhase(solver, "parse")
+        for part in self.parts:
+            answers[part], timings[part] = self.runPhase(solver, part)
+        return solver, answers, timings
+
+    def runInstrumented(self):
+        """
+        Run once more with the instrumentation enabled,
+        so that its overhead does not alter the timings.
+        """
+        reports = self.instrumentation.runSolver(self.solver_class(), self.input_path, self.parts)
+        if self.report_dir is not None:
+            self.instrumentation.save(self.day, reports, self.report_dir)
+        summary = dict()
+        for phase, report in reports.items():
+            summary[phase] = {key: value for key, value in report.items() if key != "top_functions"}
+        return summary
+
+    def runSearchMetrics(self):
+        """
+        Run once more counting the work of the best-first searches,
+        for the solvers that support it.
+        """
+        solver = self.solver_class()
+        if not hasattr(solver, "metrics"):
+            return None
+        solver.metrics = SearchMetrics()
+        solver.parse(self.input_path)
+        result = dict()
+        for part in self.parts:
+            solver.metrics.reset()
+            getattr(solver, part)()
+            result[part] = solver.metrics.asDict()
+        return result
+
+    def run(self):
+        samples = {phase: list() for phase in ["parse"] + self.parts}
+        solver = None
+        answers = None
+        redirect = open(os.devnull, "w") if self.quiet else None
+        try:
+            with contextlib.redirect_stdout(redirect) if redirect else contextlib.nullcontext():
+                for i in range(self.warmup + self.repeat):
+                    solver, answers, timings = self.runOnce()
+                    if i < self.warmup:
+                        continue
+                    for phase, elapsed in timings.items():
+                        samples[phase].append(elapsed)
+                instrumented = self.runInstrumented() if self.instrumentation is not None else None
+                search_metrics = self.runSearchMetrics() if self.search_metrics else None
+        finally:
+            if redirect is not None:
+                redirect.close()
+        report = {
+            "day": self.day,
+            "input": self.input_path,
+            "phases": {phase: summarize(values) for phase, values in samples.items()},
+            "answers": dict()
+        }
+        for i, part in enumerate(self.parts):
+            report["answers"][part] = days.formatSolution(solver, i + 1, answers[part])
+        if instrumented is not None:
+            report["instrumentation"] = instrumented
+        if search_metrics is not None:
+            report["search_metrics"] = search_metrics
+        return report
+
+
+def runDay(day, input_name=days.INPUT_NAME, warmup=1, repeat=5, quiet=True, use_cache=False,
+           instrumentation=None, report_dir=None, search_metrics=False):
+    input_path = days.getInputPath(day, input_name)
+    if not os.path.isfile(input_path):
+        return {"day": day, "input": input_path, "skipped": "missing input"}
+    try:
+        benchmark = DayBenchmark(day, input_path, warmup=warmup, repeat=repeat, quiet=quiet, use_cache=use_cache,
+                                 instrumentation=instrumentation, report_dir=report_dir,
+                                 search_metrics=search_metrics)
+        return benchmark.run()
+    except Exception as e:
+        return {"day": day, "input": input_path, "error": repr(e)}
+
+
+def formatReport(report):
+    if "skipped" in report:
+        return "Day %02d: skipped (%s)" % (report["day"], report["skipped"])
+    if "error" in report:
+        return "Day %02d: error %s" % (report["day"], report["error"])
+    result = list()
+    for phase, summary in report["phases"].items():
+        result.append("%s min %.6fs median %.6fs" % (phase, summary["min"], summary["median"]))
+    lines = ["Day %02d: %s" % (report["day"], ", ".join(result))]
+    for part, metrics in report.get("search_metrics", dict()).items():
+        lines.append("    %s: %s" % (part, ", ".join("%s %d" % item for item in metrics.items())))
+    return "\n".join(lines)
+
+
+def positiveInt(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("expected at least 1, got %d" % number)
+    return number
+
+
+def buildParser():
+    parser = argparse.ArgumentParser(description="Time parse, solve1 and solve2 of every day")
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default: all)")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs before measuring")
+    parser.add_argument("--repeat", type=positiveInt, default=5, help="timed runs (at least 1)")
+    parser.add_argument("--input", default=days.INPUT_NAME, help="name of the input file in each day folder")
+    parser.add_argument("--output", default="benchmark.json", help="where to write the JSON report")
+    parser.add_argument("--verbose", action="store_true", help="do not hide what the solvers print")
+    parser.add_argument("--cache", action="store_true", help="restore the parsed inputs from the on disk cache")
+    parser.add_argument("--profile", action="store_true", help="profile each phase with cProfile")
+    parser.add_argument("--trace-memory", action="store_true", help="trace the memory of each phase with tracemalloc")
+    parser.add_argument("--search-metrics", action="store_true",
+                        help="count pushed, popped, pruned and deduplicated states of the searches")
+    parser.add_argument("--history", nargs="?", const=history.DEFAULT_HISTORY, default=None,
+                        help="append the report to the benchmark history (default: .benchmark-history.jsonl)")
+    parser.add_argument("--report-dir", default="profiles", help="where to write the per-day instrumentation reports")
+    return parser
+
+
+def main(argv=None):
+    args = buildParser().parse_args(argv)
+    selected = args.days if len(args.days) > 0 else list(days.iterDays())
+    instrumentation = None
+    if args.profile or args.trace_memory:
+        instrumentation = Instrumentation(profile=args.profile, trace_memory=args.trace_memory)
+    reports = list()
+    for day in selected:
+        if instrumentation is not None:
+            instrumentation.profiles.clear()
+        report = runDay(day, args.input, warmup=args.warmup, repeat=args.repeat, quiet=not args.verbose,
+                        use_cache=args.cache, instrumentation=instrumentation, report_dir=args.report_dir,
+                        search_metrics=args.search_metrics)
+        print(formatReport(report), file=sys.stderr)
+        reports.append(report)
+    report = {"warmup": args.warmup, "repeat": args.repeat, "days": reports}
+    with open(args.output, "w") as hand:
+        json.dump(report, hand, indent=2)
+    if args.history is not None:
+        history.record(report, args.history)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+On disk cache of the state of a solver after parse.
+Entries are keyed by the hash of the input, of the solution source
+and of the aoc modules it imports, so editing any of them invalidates the cache.
+"""
+import hashlib
+import os
+import pickle
+import re
+import tempfile
+
+from aoc import days
+
+
+CACHE_DIR = os.path.join(days.ROOT, ".cache")
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+IMPORT_REGEX = re.compile(r"^\s*(?:from|import)\s+aoc\.(\w+)", re.MULTILINE)
+
+
+def hashFile(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as hand:
+        for chunk in iter(lambda: hand.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def getLocalImports(path):
+    """
+    :return: paths of the aoc modules imported by a source file, directly or not
+    """
+    imports = list()
+    border = [path]
+    while len(border) > 0:
+        with open(border.pop(), "r") as hand:
+            source = hand.read()
+        for name in IMPORT_REGEX.findall(source):
+            module_path = os.path.join(PACKAGE_DIR, name + ".py")
+            if module_path not in imports and os.path.isfile(module_path):
+                imports.append(module_path)
+                border.append(module_path)
+    return sorted(imports)
+
+
+def getSolverVersion(day):
+    """
+    Hash of the solution source and of the aoc modules it imports,
+    e.g. the Grid class pickled with the state of the grid days.
+    """
+    path = os.path.join(days.getDayFolder(day), "solution.py")
+    digest = hashlib.sha256()
+    for source_path in [path] + getLocalImports(path):
+        digest.update(hashFile(source_path).encode())
+    return digest.hexdigest()
+
+
+def getCachePath(day, input_path):
+    key = hashlib.sha256((hashFile(input_path) + getSolverVersion(day)).encode()).hexdigest()
+    return os.path.join(CACHE_DIR, "day%02d-%s.pickle" % (day, key))
+
+
+def load(day, solver, input_path):
+    """
+    Restore the parsed state of the solver.
+    :return: True if the state was found in the cache
+    """
+    path = getCachePath(day, input_path)
+    if not os.path.isfile(path):
+        return False
+    # The classes of the solution must be importable by pickle
+    days.loadModule(day)
+    with open(path, "rb") as hand:
+        solver.__dict__.update(pickle.load(hand))
+    return True
+
+
+def store(day, solver, input_path):
+    """
+    Save the parsed state of the solver.
+    :return: False if the state cannot be pickled (e.g. it contains lambdas) or written
+    """
+    try:
+        data = pickle.dumps(vars(solver), protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+    path = getCachePath(day, input_path)
+    tmp_path = None
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Unique temporary file, the parts of a day may be stored at the same time
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, prefix=os.path.basename(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as hand:
+            hand.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+    return True
+
+
+def parse(day, solver, input_path):
+    """
+    Same as solver.parse(input_path), reusing the cached state when available.
+    """
+    if load(day, solver, input_path):
+        return
+    solver.parse(input_path)
+    store(day, solver, input_path)
+
+
+def clear():
+    if not os.path.isdir(CACHE_DIR):
+        return
+    for name in os.listdir(CACHE_DIR):
+        if name.endswith(".pickle") or name.endswith(".tmp"):
+            os.remove(os.path.join(CACHE_DIR, name))
+
+
+if __name__ == "__main__":
+    clear()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Long lived service keeping the parsed solvers in memory.
+Requests and responses are JSON objects, one per line, on a Unix domain socket:
+    {"day": 17, "query": "height", "args": [2022]}
+    {"result": 3068}
+"""
+import argparse
+import contextlib
+import copy
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+
+from aoc import cache
+from aoc import days
+
+
+DEFAULT_SOCKET = "/tmp/aoc-solvers.sock"
+
+# Day specific queries, mapped to the method of the solver
+QUERIES = {
+    4: {"overlapping": "countOverlapping", "contained": "countContained", "containing": "countContaining"},
+    7: {"total_below": "totalBelow", "smallest_freeing": "smallestFreeing", "update": "update"},
+    9: {"tail_positions": "countTailPositions"},
+    10: {"x": "getX", "signal_strength": "getSignalStrength"},
+    11: {"monkey_business": "run"},
+    15: {"coverage": "countCoveredOnRow"},
+    17: {"height": "simulate"}
+}
+
+# Days whose parts modify the parsed state, they answer on a copy of it
+MUTATING_DAYS = {14, 21}
+
+
+class SolverPool:
+
+    def __init__(self, input_name=days.INPUT_NAME, use_cache=False):
+        self.input_name = input_name
+        self.use_cache = use_cache
+        self.solvers = dict()
+        self.locks = dict()
+        self.lock = threading.Lock()
+
+    def getLock(self, day):
+        with self.lock:
+            if day not in self.locks:
+                self.locks[day] = threading.Lock()
+            return self.locks[day]
+
+    def load(self, day):
+        """
+        Parse the input of the day, once.
+        Must be called holding the lock of the day.
+        """
+        if day in self.solvers:
+            return self.solvers[day]
+        input_path = days.getInputPath(day, self.input_name)
+        if not os.path.isfile(input_path):
+            raise Exception("Missing input " + input_path)
+        solver = days.loadSolver(day)()
+        if self.use_cache:
+            cache.parse(day, solver, input_path)
+        else:
+            solver.parse(input_path)
+        self.solvers[day] = solver
+        return solver
+
+    def query(self, day, query, args):
+        # Every day answers the parts its solver implements
+        methods = {part: part for part in days.getParts(days.loadSolver(day))}
+        methods.update(QUERIES.get(day, dict()))
+        if query not in methods:
+            raise Exception("Unknown query %s for day %d, expected one of %s" % (query, day, ", ".join(methods)))
+        with self.getLock(day):
+            solver = self.load(day)
+            if day in MUTATING_DAYS:
+                solver = copy.deepcopy(solver)
+            return getattr(solver, methods[query])(*args)
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                result = self.server.pool.query(int(request["day"]), request["query"], request.get("args", []))
+                response = {"result": result}
+            except Exception as e:
+                response = {"error": repr(e)}
+            self.wfile.write((json.dumps(response, default=str) + "\n").encode())
+            self.wfile.flush()
+
+
+class SolverServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path, pool):
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        super().__init__(socket_path, RequestHandler)
+        self.pool = pool
+
+
+def query(day, name, args, socket_path=DEFAULT_SOCKET):
+    """
+    Send a query to a running daemon.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        request = {"day": day, "query": name, "args": args}
+        client.sendall((json.dumps(request) + "\n").encode())
+        with client.makefile("r") as hand:
+            response = json.loads(hand.readline())
+    if "error" in response:
+        raise Exception(response["error"])
+    return response["result"]
+
+
+def serve(socket_path, selected, input_name=days.INPUT_NAME, use_cache=False):
+    # The progress printed by the solvers is discarded for the whole process,
+    # redirecting it per query is not safe with queries running in parallel threads
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        pool = SolverPool(input_name, use_cache)
+        for day in selected:
+            with pool.getLock(day):
+                pool.load(day)
+        # Exit through serve_forever, so that the socket is removed
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        with SolverServer(socket_path, pool) as server:
+            try:
+                server.serve_forever()
+            finally:
+                os.remove(socket_path)
+
+
+def buildParser():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--socket", default=DEFAULT_SOCKET)
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve_parser = commands.add_parser("serve", help="start the daemon")
+    serve_parser.add_argument("days", nargs="*", type=int, help="days to parse at start (default: all with an input)")
+    serve_parser.add_argument("--input", default=days.INPUT_NAME, help="name of the input file in each day folder")
+    serve_parser.add_argument("--cache", action="store_true", help="restore the parsed inputs from the on disk cache")
+    query_parser = commands.add_parser("query", help="query a running daemon")
+    query_parser.add_argument("day", type=int)
+    query_parser.add_argument("query", help="a part of the day (solve1, solve2) or a query of the day")
+    query_parser.add_argument("args", nargs="*", type=json.loads, help="arguments of the query, as JSON")
+    return parser
+
+
+def main(argv=None):
+    args = buildParser().parse_args(argv)
+    if args.command == "serve":
+        selected = args.days
+        if len(selected) == 0:
+            selected = [day for day in days.iterDays() if os.path.isfile(days.getInputPath(day, args.input))]
+        serve(args.socket, selected, args.input, args.cache)
+    else:
+        try:
+            print(query(args.day, args.query, args.args, args.socket))
+        except Exception as e:
+            sys.exit(str(e))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+import contextlib
+import importlib.util
+import io
+import os
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INPUT_NAME = "input"
+PARTS = ("solve1", "solve2")
+
+
+def iterDays():
+    for name in sorted(os.listdir(ROOT)):
+        if len(name) == 2 and name.isdigit() and os.path.isfile(os.path.join(ROOT, name, "solution.py")):
+            yield int(name)
+
+
+def getDayFolder(day):
+    return os.path.join(ROOT, "%02d" % day)
+
+
+def getInputPath(day, input_name=INPUT_NAME):
+    return os.path.join(getDayFolder(day), input_name)
+
+
+def loadModule(day):
+    """
+    Import the solution of the given day.
+    The module is registered as dayNN so that the objects
+    it creates can be pickled.
+    :param day:
+    :return:
+    """
+    name = "day%02d" % day
+    if name in sys.modules:
+        return sys.modules[name]
+    path = os.path.join(getDayFolder(day), "solution.py")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def loadSolver(day):
+    return loadModule(day).Solver
+
+
+def getParts(solver_class):
+    return [part for part in PARTS if hasattr(solver_class, part)]
+
+
+def formatSolution(solver, part_number, value):
+    """
+    Format a solution the same way the __main__ block of each day does.
+    """
+    if isinstance(value, (int, str)):
+        return "Solution %d: %s" % (part_number, value)
+    if hasattr(solver, "printCrt"):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            solver.printCrt(value)
+        value = output.getvalue().rstrip("\n")
+    return "Solution %d:\n%s" % (part_number, value)
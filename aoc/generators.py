@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+"""
+Generators of synthetic puzzle inputs.
+With scale 1 the size of the input is close to the real one,
+the amount of lines (or cells, sensors, valves...) grows linearly with the scale.
+"""
+import argparse
+import json
+import math
+import random
+import string
+
+from aoc import days
+
+
+def scaleSide(side, scale, dimensions=2):
+    """
+    Scale the side of a grid such that the number of cells grows linearly with the scale.
+    """
+    return max(1, int(round(side * scale ** (1.0 / dimensions))))
+
+
+def generate01(rng, scale):
+    lines = list()
+    for i in range(250 * scale):
+        if i > 0:
+            lines.append("")
+        for _ in range(rng.randint(1, 15)):
+            lines.append(str(rng.randint(1000, 60000)))
+    return lines
+
+
+def generate02(rng, scale):
+    return ["%s %s" % (rng.choice("ABC"), rng.choice("XYZ")) for _ in range(2500 * scale)]
+
+
+def _generateRucksack(rng, pool, badge):
+    """
+    Generate a rucksack with items from pool and the badge.
+    Exactly one item is in both compartments.
+    """
+    shared = rng.choice(pool + [badge])
+    others = [item for item in pool if item != shared]
+    rng.shuffle(others)
+    split = rng.randint(1, max(1, len(others) - 1))
+    left = others[:split] + [shared]
+    right = others[split:] + [shared]
+    if shared != badge:
+        (left if rng.random() < 0.5 else right).append(badge)
+    size = rng.randint(max(len(left), len(right)), 24)
+    left = left + [rng.choice(left) for _ in range(size - len(left))]
+    right = right + [rng.choice(right) for _ in range(size - len(right))]
+    rng.shuffle(left)
+    rng.shuffle(right)
+    return "".join(left) + "".join(right)
+
+
+def generate03(rng, scale):
+    lines = list()
+    for _ in range(100 * scale):
+        items = list(string.ascii_letters)
+        rng.shuffle(items)
+        badge = items.pop()
+        # Each rucksack of the group uses different items, so only the badge is in all three
+        for i in range(3):
+            pool = items[i * 17:(i + 1) * 17]
+            lines.append(_generateRucksack(rng, rng.sample(pool, rng.randint(2, 12)), badge))
+    return lines
+
+
+def generate04(rng, scale):
+    lines = list()
+    for _ in range(1000 * scale):
+        intervals = list()
+        for _ in range(2):
+            start = rng.randint(1, 99)
+            intervals.append("%d-%d" % (start, rng.randint(start, 99)))
+        lines.append(",".join(intervals))
+    return lines
+
+
+def generate05(rng, scale):
+    n_stacks = 9
+    heights = [rng.randint(1, 8 * scale) for _ in range(n_stacks)]
+    stacks = [[rng.choice(string.ascii_uppercase) for _ in range(height)] for height in heights]
+    lines = list()
+    for level in range(max(heights) - 1, -1, -1):
+        crates = ["[%s]" % stack[level] if level < len(stack) else "   " for stack in stacks]
+        lines.append(" ".join(crates))
+    lines.append(" " + "   ".join(str(i + 1) for i in range(n_stacks)) + " ")
+    lines.append("")
+    for _ in range(500 * scale):
+        # Never empty a stack, so every stack has a top crate at the end
+        sources = [i for i in range(n_stacks) if heights[i] > 1]
+        source = rng.choice(sources)
+        target = rng.choice([i for i in range(n_stacks) if i != source])
+        n_el = rng.randint(1, min(heights[source] - 1, 30))
+        heights[source] -= n_el
+        heights[target] += n_el
+        lines.append("move %d from %d to %d" % (n_el, source + 1, target + 1))
+    return lines
+
+
+def generate06(rng, scale):
+    # Three letters cannot make a marker, so the markers are only in the tail
+    stream = [rng.choice("abc") for _ in range(4096 * scale)]
+    stream.extend(rng.sample(string.ascii_lowercase[3:], 14))
+    return ["".join(stream)]
+
+
+def generate07(rng, scale):
+    n_folders = 150 * scale
+    children = [list() for _ in range(n_folders)]
+    for folder in range(1, n_folders):
+        # Prefer recent folders to obtain deep paths
+        parent = rng.randint(max(0, folder - 10), folder - 1)
+        children[parent].append(folder)
+    lines = list()
+    stack = [(0, "/")]
+    while len(stack) > 0:
+        folder, name = stack.pop()
+        if folder is None:
+            lines.append("$ cd ..")
+            continue
+        lines.append("$ cd %s" % name)
+        lines.append("$ ls")
+        for child in children[folder]:
+            lines.append("dir d%d" % child)
+        for i in range(rng.randint(0, 5)):
+            lines.append("%d f%d.txt" % (rng.randint(1000, 300000), i))
+        if folder > 0:
+            stack.append((None, None))
+        for child in reversed(children[folder]):
+            stack.append((child, "d%d" % child))
+    return lines
+
+
+def generate08(rng, scale):
+    side = scaleSide(99, scale)
+    return ["".join(rng.choice(string.digits) for _ in range(side)) for _ in range(side)]
+
+
+def generate09(rng, scale):
+    return ["%s %d" % (rng.choice("RLUD"), rng.randint(1, 20)) for _ in range(2000 * scale)]
+
+
+def generate10(rng, scale):
+    lines = list()
+    x = 1
+    for _ in range(140 * scale):
+        if rng.random() < 0.3:
+            lines.append("noop")
+        else:
+            # Keep the sprite on the screen
+            qty = rng.choice([v for v in range(-20, 21) if v != 0 and 0 <= x + v < 40])
+            x += qty
+            lines.append("addx %d" % qty)
+    return lines
+
+
+def generate11(rng, scale):
+    n_monkeys = 8
+    divisors = [2, 3, 5, 7, 11, 13, 17, 19]
+    rng.shuffle(divisors)
+    square = rng.randrange(n_monkeys)
+    lines = list()
+    for monkey in range(n_monkeys):
+        items = [str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8) * scale)]
+        if monkey == square:
+            operation = "old * old"
+        else:
+            operation = "old %s %d" % (rng.choice("*+"), rng.randint(1, 19))
+        targets = rng.sample([other for other in range(n_monkeys) if other != monkey], 2)
+        lines.append("Monkey %d:" % monkey)
+        lines.append("  Starting items: %s" % ", ".join(items))
+        lines.append("  Operation: new = %s" % operation)
+        lines.append("  Test: divisible by %d" % divisors[monkey])
+        lines.append("    If true: throw to monkey %d" % targets[0])
+        lines.append("    If false: throw to monkey %d" % targets[1])
+        lines.append("")
+    return lines[:-1]
+
+
+def generate12(rng, scale):
+    n_rows = scaleSide(41, scale)
+    n_cols = max(26, scaleSide(160, scale))
+    start = (n_rows // 2, 0)
+    end = (n_rows // 2, n_cols - 1)
+    lines = list()
+    for x in range(n_rows):
+        row = list()
+        for y in range(n_cols):
+            # Heights grow by at most one each column, with a few holes
+            height = y * 26 // n_cols
+            if (x, y) != start and (x, y) != end and rng.random() < 0.05:
+                height = 0
+            row.append(chr(ord('a') + height))
+        lines.append(row)
+    lines[start[0]][start[1]] = 'S'
+    lines[end[0]][end[1]] = 'E'
+    return ["".join(row) for row in lines]
+
+
+def generate13(rng, scale):
+    def generatePacket(depth):
+        packet = list()
+        for _ in range(rng.randint(0, 5)):
+            if depth < 4 and rng.random() < 0.3:
+                packet.append(generatePacket(depth + 1))
+            else:
+                packet.append(rng.randint(0, 10))
+        return packet
+
+    lines = list()
+    for i in range(150 * scale):
+        if i > 0:
+            lines.append("")
+        for _ in range(2):
+            lines.append(json.dumps(generatePacket(0), separators=(",", ":")))
+    return lines
+
+
+def generate14(rng, scale):
+    max_y = scaleSide(170, scale)
+    lines = list()
+    for _ in range(150 * scale):
+        x = rng.randint(500 - max_y // 2, 500 + max_y // 2)
+        y = rng.randint(13, max_y)
+        points = ["%d,%d" % (x, y)]
+        for i in range(rng.randint(1, 5)):
+            if i % 2 == 0:
+                x = max(0, x + rng.randint(-8, 8))
+            else:
+                y = min(max_y, max(13, y + rng.randint(-8, 8)))
+            points.append("%d,%d" % (x, y))
+        lines.append(" -> ".join(points))
+    return lines
+
+
+def generate15(rng, scale):
+    """
+    The sensors are on a lattice with spacing r and cover a range of 2r,
+    so every point of the space is covered.
+    The sensors within 2r of the distress beacon are then shrunk
+    such that only the distress beacon is left uncovered.
+    """
+    max_coord = 4000000
+    side = max(3, int(round(math.sqrt(25 * scale))) - 3)
+    spacing = int(math.ceil(max_coord / side))
+    target = (rng.randint(0, max_coord), rng.randint(0, max_coord))
+    lines = list()
+    for i in range(-1, side + 2):
+        for j in range(-1, side + 2):
+            sx, sy = i * spacing, j * spacing
+            distance = abs(sx - target[0]) + abs(sy - target[1])
+            coverage = 2 * spacing if distance > 2 * spacing else distance - 1
+            lines.append("Sensor at x=%d, y=%d: closest beacon is at x=%d, y=%d" % (sx, sy, sx + coverage, sy))
+    rng.shuffle(lines)
+    return lines
+
+
+def _valveName(i):
+    length = 2
+    while i >= 26 ** length:
+        i -= 26 ** length
+        length += 1
+    name = ""
+    for _ in range(length):
+        name = string.ascii_uppercase[i % 26] + name
+        i = i // 26
+    return name
+
+
+def generate16(rng, scale):
+    n_valves = 60 * scale
+    names = [_valveName(i) for i in range(n_valves)]
+    tunnels = [set() for _ in range(n_valves)]
+    for valve in range(1, n_valves):
+        other = rng.randrange(valve)
+        tunnels[valve].add(other)
+        tunnels[other].add(valve)
+    for _ in range(n_valves // 4):
+        a, b = rng.sample(range(n_valves), 2)
+        tunnels[a].add(b)
+        tunnels[b].add(a)
+    with_flow = set(rng.sample(range(1, n_valves), min(n_valves - 1, 15 * scale)))
+    lines = list()
+    for valve in range(n_valves):
+        flow = rng.randint(3, 25) if valve in with_flow else 0
+        connected = ", ".join(names[other] for other in sorted(tunnels[valve]))
+        if len(tunnels[valve]) == 1:
+            lines.append("Valve %s has flow rate=%d; tunnel leads to valve %s" % (names[valve], flow, connected))
+        else:
+            lines.append("Valve %s has flow rate=%d; tunnels lead to valves %s" % (names[valve], flow, connected))
+    return lines
+
+
+def generate17(rng, scale):
+    return ["".join(rng.choice("<>") for _ in range(1000 * scale))]
+
+
+def generate18(rng, scale):
+    side = scaleSide(20, scale, dimensions=3)
+    lines = list()
+    for x in range(side):
+        for y in range(side):
+            for z in range(side):
+                if rng.random() < 0.35:
+                    lines.append("%d,%d,%d" % (x, y, z))
+    rng.shuffle(lines)
+    return lines
+
+
+def generate19(rng, scale):
+    lines = list()
+    for i in range(30 * scale):
+        lines.append(
+            "Blueprint %d: Each ore robot costs %d ore. Each clay robot costs %d ore. "
+            "Each obsidian robot costs %d ore and %d clay. Each geode robot costs %d ore and %d obsidian." % (
+                i + 1, rng.randint(2, 4), rng.randint(2, 4),
+                rng.randint(2, 4), rng.randint(5, 20), rng.randint(2, 4), rng.randint(5, 20)))
+    return lines
+
+
+def generate20(rng, scale):
+    values = [rng.choice([-1, 1]) * rng.randint(1, 10000) for _ in range(5000 * scale - 1)]
+    values.insert(rng.randrange(len(values) + 1), 0)
+    return list(map(str, values))
+
+
+def generate21(rng, scale):
+    """
+    Build the expression tree top down, choosing the operations
+    such that every division is exact and every value is positive.
+    Both sides of root have the same value, so the value given to humn
+    is the solution of the second part.
+    """
+    n_monkeys = min(2000 * scale, 26 ** 4 - 2)
+    names = set()
+    while len(names) < n_monkeys:
+        name = "".join(rng.choice(string.ascii_lowercase) for _ in range(4))
+        if name not in ("root", "humn"):
+            names.add(name)
+    names = list(names)
+    rng.shuffle(names)
+    value = rng.randint(10 ** 6, 10 ** 9)
+    operations = dict()
+    left, right = names.pop(), names.pop()
+    operations["root"] = "%s + %s" % (left, right)
+    border = [(left, value, True), (right, value, False)]
+    leaves = list()
+    while len(border) > 0:
+        i = rng.randrange(len(border))
+        border[i], border[-1] = border[-1], border[i]
+        monkey, value, human_side = border.pop()
+        if len(names) < 2 or value < 2:
+            leaves.append((monkey, value, human_side))
+            continue
+        choice = rng.random()
+        divisors = [d for d in range(2, 20) if value % d == 0]
+        if choice < 0.3 or value > 10 ** 12:
+            a = rng.randint(1, value - 1)
+            op, values = "+", (a, value - a)
+        elif choice < 0.55 and len(divisors) > 0:
+            d = rng.choice(divisors)
+            op, values = "*", (value // d, d)
+        elif choice < 0.8:
+            b = rng.randint(1, 1000)
+            op, values = "-", (value + b, b)
+        else:
+            b = rng.randint(2, 10)
+            op, values = "/", (value * b, b)
+        children = (names.pop(), names.pop())
+        operations[monkey] = "%s %s %s" % (children[0], op, children[1])
+        for child, child_value in zip(children, values):
+            border.append((child, child_value, human_side))
+    human = rng.choice([leaf for leaf in leaves if leaf[2]])
+    for monkey, value, _ in leaves:
+        operations[monkey] = str(value)
+    operations["humn"] = operations.pop(human[0])
+    for monkey, operation in operations.items():
+        operations[monkey] = " ".join("humn" if el == human[0] else el for el in operation.split(" "))
+    lines = ["%s: %s" % item for item in operations.items()]
+    rng.shuffle(lines)
+    return lines
+
+
+def generate22(rng, scale):
+    size = 50
+    # Same layout of the cube as the real inputs
+    faces = [(1, 0), (2, 0), (1, 1), (0, 2), (1, 2), (0, 3)]
+    lines = list()
+    for y in range(4 * size):
+        row = list()
+        for x in range(3 * size):
+            if (x // size, y // size) not in faces:
+                row.append(" ")
+            elif (x, y) != (size, 0) and rng.random() < 0.05:
+                row.append("#")
+            else:
+                row.append(".")
+        lines.append("".join(row).rstrip())
+    lines.append("")
+    instructions = [str(rng.randint(1, 50))]
+    for _ in range(2000 * scale):
+        instructions.append(rng.choice("LR"))
+        instructions.append(str(rng.randint(1, 50)))
+    lines.append("".join(instructions))
+    return lines
+
+
+def generate23(rng, scale):
+    side = scaleSide(70, scale)
+    return ["".join("#" if rng.random() < 0.5 else "." for _ in range(side)) for _ in range(side)]
+
+
+def generate24(rng, scale):
+    k = scaleSide(1, scale)
+    width, height = 120 * k, 25 * k
+    lines = ["#." + "#" * width]
+    for _ in range(height):
+        row = list()
+        for x in range(width):
+            if rng.random() >= 0.75:
+                row.append(".")
+            elif x == 0 or x == width - 1:
+                # No blizzard goes through the entrance and the exit
+                row.append(rng.choice("<>"))
+            else:
+                row.append(rng.choice("<>^v"))
+        lines.append("#" + "".join(row) + "#")
+    lines.append("#" * width + ".#")
+    return lines
+
+
+def _toSnafu(value):
+    digits = list()
+    while value > 0:
+        value, digit = divmod(value, 5)
+        if digit > 2:
+            digit -= 5
+            value += 1
+        digits.append("=-012"[digit + 2])
+    return "".join(reversed(digits))
+
+
+def generate25(rng, scale):
+    return [_toSnafu(rng.randint(1, 10 ** rng.randint(1, 15))) for _ in range(120 * scale)]
+
+
+GENERATORS = {
+    1: generate01, 2: generate02, 3: generate03, 4: generate04, 5: generate05,
+    6: generate06, 7: generate07, 8: generate08, 9: generate09, 10: generate10,
+    11: generate11, 12: generate12, 13: generate13, 14: generate14, 15: generate15,
+    16: generate16, 17: generate17, 18: generate18, 19: generate19, 20: generate20,
+    21: generate21, 22: generate22, 23: generate23, 24: generate24, 25: generate25
+}
+
+
+def generate(day, scale=1, seed=0):
+    rng = random.Random("%d-%d-%d" % (day, scale, seed))
+    return "\n".join(GENERATORS[day](rng, scale)) + "\n"
+
+
+def writeInput(day, output_path, scale=1, seed=0):
+    with open(output_path, "w") as hand:
+        hand.write(generate(day, scale, seed))
+
+
+def buildParser():
+    parser = argparse.ArgumentParser(description="Generate synthetic inputs in the day folders")
+    parser.add_argument("days", nargs="*", type=int, help="days to generate (default: all)")
+    parser.add_argument("--scale", type=int, default=1, help="size of the input relative to a real one")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--name", default=None, help="name of the generated file (default: input_xSCALE)")
+    return parser
+
+
+def main(argv=None):
+    args = buildParser().parse_args(argv)
+    selected = args.days if len(args.days) > 0 else list(days.iterDays())
+    name = args.name if args.name is not None else "input_x%d" % args.scale
+    for day in selected:
+        writeInput(day, days.getInputPath(day, name), scale=args.scale, seed=args.seed)
+
+
+if __name__ == "__main__":
+    main()
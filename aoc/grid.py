@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+
+
+def makeTable(mapping, default=0):
+    """
+    Build a translation table for bytes.translate
+    from a dict of characters to cell values.
+    """
+    table = bytearray([default]) * 256
+    for ch, value in mapping.items():
+        table[ord(ch)] = value
+    return bytes(table)
+
+
+DIGITS = makeTable({str(i): i for i in range(10)})
+
+
+class Grid:
+    """
+    Two-dimensional grid of small integers (0-255) stored row by row in a flat bytearray.
+    A cell (x, y) is addressed by the packed index y * width + x.
+    """
+
+    def __init__(self, width, height, fill=0):
+        self.width = width
+        self.height = height
+        self.cells = bytearray([fill]) * (width * height)
+
+    @classmethod
+    def fromLines(cls, lines, table=None, fill=0):
+        """
+        Build a grid from lines of text, translating each character with table.
+        Lines shorter than the longest one are padded with fill.
+        """
+        width = max(map(len, lines)) if len(lines) > 0 else 0
+        grid = cls(width, len(lines), fill)
+        for y, line in enumerate(lines):
+            row = line.encode()
+            if table is not None:
+                row = row.translate(table)
+            grid.cells[y * width:y * width + len(row)] = row
+        return grid
+
+    def copy(self):
+        grid = Grid(0, 0)
+        grid.width = self.width
+        grid.height = self.height
+        grid.cells = self.cells[:]
+        return grid
+
+    def index(self, x, y):
+        return y * self.width + x
+
+    def unpack(self, index):
+        y, x = divmod(index, self.width)
+        return x, y
+
+    def contains(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def get(self, x, y):
+        return self.cells[y * self.width + x]
+
+    def set(self, x, y, value):
+        self.cells[y * self.width + x] = value
+
+    def __getitem__(self, index):
+        return self.cells[index]
+
+    def __setitem__(self, index, value):
+        self.cells[index] = value
+
+    def __len__(self):
+        return len(self.cells)
+
+    def iterNeighbours(self, index):
+        """
+        Yield the packed index of the horizontal and vertical neighbours inside the grid.
+        """
+        x = index % self.width
+        if index >= self.width:
+            yield index - self.width
+        if index + self.width < len(self.cells):
+            yield index + self.width
+        if x > 0:
+            yield index - 1
+        if x < self.width - 1:
+            yield index + 1
+
+    def getRow(self, y):
+        return self.cells[y * self.width:(y + 1) * self.width]
+
+    def setRow(self, y, values):
+        self.cells[y * self.width:(y + 1) * self.width] = values
+
+    def fillRow(self, y, value):
+        self.cells[y * self.width:(y + 1) * self.width] = bytes([value]) * self.width
+
+    def addRows(self, count, fill=0):
+        self.cells.extend(bytes([fill]) * (count * self.width))
+        self.height += count
+
+    def count(self, value):
+        return self.cells.count(value)
+
+    def toLines(self, icons):
+        """
+        Render the grid with the given icon for each cell value.
+        """
+        table = bytes(ord(icons[i]) if i < len(icons) else ord("?") for i in range(256))
+        rows = self.cells.translate(table).decode()
+        return [rows[y * self.width:(y + 1) * self.width] for y in range(self.height)]
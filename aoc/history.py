@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+History of the benchmark runs, stored as JSON lines,
+and comparison of a run against a baseline.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+
+from aoc import days
+
+
+DEFAULT_HISTORY = os.path.join(days.ROOT, ".benchmark-history.jsonl")
+
+
+def getCommit():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=days.ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        status = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=days.ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+    return commit, len(status) > 0
+
+
+def getMachine():
+    return {
+        "node": platform.node(),
+        "system": platform.system(),
+        "release": platform.release(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count()
+    }
+
+
+def record(report, path=DEFAULT_HISTORY):
+    """
+    Append a benchmark report to the history.
+    """
+    commit, dirty = getCommit()
+    entry = {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "commit": commit,
+        "dirty": dirty,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": getMachine(),
+        "report": report
+    }
+    with open(path, "a") as hand:
+        hand.write(json.dumps(entry) + "\n")
+    return entry
+
+
+def load(path=DEFAULT_HISTORY):
+    entries = list()
+    if not os.path.isfile(path):
+        return entries
+    with open(path, "r") as hand:
+        for line in hand:
+            line = line.strip()
+            if len(line) > 0:
+                entries.append(json.loads(line))
+    return entries
+
+
+def findEntry(entries, reference):
+    """
+    Find an entry by position in the history (e.g. -1 is the last run)
+    or by commit, taking the last run of that commit.
+    """
+    try:
+        position = int(reference)
+    except ValueError:
+        position = None
+    if position is not None and -len(entries) <= position < len(entries):
+        return entries[position]
+    for entry in reversed(entries):
+        if entry["commit"] is not None and entry["commit"].startswith(reference):
+            return entry
+    raise Exception("No run %s in the history of %d runs" % (reference, len(entries)))
+
+
+def getMedians(entry):
+    """
+    :return: dict of (day, input, phase) to the median time
+    """
+    medians = dict()
+    for day_report in entry["report"]["days"]:
+        for phase, summary in day_report.get("phases", dict()).items():
+            medians[(day_report["day"], day_report["input"], phase)] = summary["median"]
+    return medians
+
+
+def compare(baseline, candidate, threshold=0.1):
+    """
+    Compare the median of every day and phase measured on the same input in both runs.
+    :return: list of (day, phase, baseline median, candidate median, relative change, is regression)
+    """
+    baseline_medians = getMedians(baseline)
+    result = list()
+    for key, median in sorted(getMedians(candidate).items()):
+        if key not in baseline_medians:
+            continue
+        day, _, phase = key
+        change = median / baseline_medians[key] - 1 if baseline_medians[key] > 0 else 0.0
+        result.append((day, phase, baseline_medians[key], median, change, change > threshold))
+    return result
+
+
+def describe(entry):
+    commit = (entry["commit"] or "unknown")[:10] + ("+" if entry["dirty"] else "")
+    return "%s %s Python %s on %s" % (entry["timestamp"], commit, entry["python"], entry["machine"]["node"])
+
+
+def buildParser():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="history file")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="list the recorded runs")
+    compare_parser = commands.add_parser("compare", help="flag the phases slower than the baseline")
+    compare_parser.add_argument("--baseline", default="-2", help="position in the history or commit (default: -2)")
+    compare_parser.add_argument("--candidate", default="-1", help="position in the history or commit (default: -1)")
+    compare_parser.add_argument("--threshold", type=float, default=0.1,
+                                help="relative slowdown of the median flagged as regression (default: 0.1)")
+    return parser
+
+
+def main(argv=None):
+    args = buildParser().parse_args(argv)
+    entries = load(args.history)
+    if args.command == "list":
+        for i, entry in enumerate(entries):
+            print("%3d %s" % (i, describe(entry)))
+        return
+    try:
+        baseline = findEntry(entries, args.baseline)
+        candidate = findEntry(entries, args.candidate)
+    except Exception as e:
+        sys.exit(str(e))
+    print("Baseline:  " + describe(baseline))
+    print("Candidate: " + describe(candidate))
+    regressions = 0
+    for day, phase, baseline_median, candidate_median, change, regressed in compare(baseline, candidate, args.threshold):
+        print("%s Day %02d %-6s %.6fs -> %.6fs (%+.1f%%)" % (
+            "REGRESSION" if regressed else "          ", day, phase, baseline_median, candidate_median, 100 * change))
+        regressions += 1 if regressed else 0
+    if regressions > 0:
+        sys.exit("%d phases slowed down by more than %.0f%%" % (regressions, 100 * args.threshold))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+
+class SearchMetrics:
+    """
+    Counters of the best-first searches.
+    Solvers with a metrics attribute record their search when it is set
+    to an instance of this class, and do nothing when it is None.
+    """
+
+    def __init__(self):
+        self.pushed = 0
+        self.popped = 0
+        self.pruned = 0
+        self.deduplicated = 0
+        self.peak_queue = 0
+
+    def reset(self):
+        self.__init__()
+
+    def push(self, queue_size):
+        self.pushed += 1
+        self.peak_queue = max(self.peak_queue, queue_size)
+
+    def pop(self):
+        self.popped += 1
+
+    def prune(self):
+        self.pruned += 1
+
+    def deduplicate(self):
+        self.deduplicated += 1
+
+    def asDict(self):
+        return {
+            "pushed": self.pushed,
+            "popped": self.popped,
+            "pruned": self.pruned,
+            "deduplicated": self.deduplicated,
+            "peak_queue": self.peak_queue
+        }
+
+    def __str__(self):
+        return ", ".join("%s %d" % item for item in self.asDict().items())
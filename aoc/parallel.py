@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+import argparse
+import concurrent.futures
+import contextlib
+import json
+import os
+
+from aoc import cache
+from aoc import days
+from aoc.benchmark import timeCall, summarize
+
+
+def runTask(day, part, input_path, use_cache=False):
+    """
+    Parse the input and run a single part on a fresh solver.
+    Executed in a worker process.
+    :return: the formatted solution and the time of parse and part
+    """
+    solver = days.loadSolver(day)()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        if use_cache:
+            _, parse_time = timeCall(cache.parse, day, solver, input_path)
+        else:
+            _, parse_time = timeCall(solver.parse, input_path)
+        value, part_time = timeCall(getattr(solver, part))
+    part_number = days.PARTS.index(part) + 1
+    return days.formatSolution(solver, part_number, value), parse_time, part_time
+
+
+def loadExpectedTimes(report_path):
+    """
+    Read the expected time of each (day, part) task
+    from a report written by the benchmark runner.
+    """
+    expected = dict()
+    if report_path is None or not os.path.isfile(report_path):
+        return expected
+    with open(report_path, "r") as hand:
+        report = json.load(hand)
+    for day_report in report["days"]:
+        phases = day_report.get("phases")
+        if phases is None:
+            continue
+        for part in days.PARTS:
+            if part in phases:
+                expected[(day_report["day"], part)] = phases["parse"]["median"] + phases[part]["median"]
+    return expected
+
+
+def scheduleTasks(tasks, expected):
+    """
+    Sort the tasks longest expected first.
+    Tasks that were never timed are scheduled before all the others.
+    """
+    return sorted(tasks, key=lambda task: -1 * expected.get(task, float("inf")))
+
+
+def runAll(selected, input_name=days.INPUT_NAME, workers=None, expected=None, use_cache=False):
+    """
+    Run every part of the selected days on a process pool.
+    Each part parses its own input, so no state is shared between parts.
+    :return: dict of (day, part) to (solution, parse_time, part_time) or an exception
+    """
+    tasks = list()
+    for day in selected:
+        input_path = days.getInputPath(day, input_name)
+        if not os.path.isfile(input_path):
+            continue
+        for part in days.getParts(days.loadSolver(day)):
+            tasks.append((day, part))
+    results = dict()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = dict()
+        for day, part in scheduleTasks(tasks, expected or dict()):
+            future = executor.submit(runTask, day, part, days.getInputPath(day, input_name), use_cache)
+            futures[future] = (day, part)
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                results[futures[future]] = e
+    return results
+
+
+def saveTimings(results, output_path):
+    """
+    Write the measured times in the same format of the benchmark report,
+    so that they can be used to schedule the next run.
+    """
+    parse_times = dict()
+    reports = dict()
+    for (day, part), result in sorted(results.items()):
+        if isinstance(result, Exception):
+            continue
+        _, parse_time, part_time = result
+        parse_times.setdefault(day, list()).append(parse_time)
+        report = reports.setdefault(day, {"day": day, "phases": dict()})
+        report["phases"][part] = summarize([part_time])
+    for day, report in reports.items():
+        report["phases"]["parse"] = summarize(parse_times[day])
+    with open(output_path, "w") as hand:
+        json.dump({"warmup": 0, "repeat": 1, "days": list(reports.values())}, hand, indent=2)
+
+
+def buildParser():
+    parser = argparse.ArgumentParser(description="Solve every day in parallel")
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default: all)")
+    parser.add_argument("--workers", type=int, default=None, help="number of processes (default: all cores)")
+    parser.add_argument("--input", default=days.INPUT_NAME, help="name of the input file in each day folder")
+    parser.add_argument("--timings", default="benchmark.json",
+                        help="benchmark report used to schedule the slowest parts first")
+    parser.add_argument("--cache", action="store_true", help="restore the parsed inputs from the on disk cache")
+    parser.add_argument("--save-timings", default=None, help="write the measured times to this report")
+    return parser
+
+
+def main(argv=None):
+    args = buildParser().parse_args(argv)
+    selected = args.days if len(args.days) > 0 else list(days.iterDays())
+    results = runAll(selected, args.input, workers=args.workers, expected=loadExpectedTimes(args.timings),
+                     use_cache=args.cache)
+    for day in sorted(selected):
+        day_results = [(part, results[(day, part)]) for part in days.PARTS if (day, part) in results]
+        if len(day_results) == 0:
+            continue
+        print("Day %02d" % day)
+        for part, result in day_results:
+            if isinstance(result, Exception):
+                print("Solution %d: error %r" % (days.PARTS.index(part) + 1, result))
+            else:
+                print(result[0])
+    if args.save_timings is not None:
+        saveTimings(results, args.save_timings)
+
+
+if __name__ == "__main__":
+    main()
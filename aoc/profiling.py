@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+import cProfile
+import json
+import os
+import pstats
+import time
+import tracemalloc
+
+
+def getTopFunctions(profile, top):
+    stats = pstats.Stats(profile)
+    functions = list()
+    for (file_name, line, name), (_, n_calls, total_time, cumulative_time, _) in stats.stats.items():
+        functions.append({
+            "function": "%s:%d(%s)" % (os.path.basename(file_name), line, name),
+            "calls": n_calls,
+            "total_time": total_time,
+            "cumulative_time": cumulative_time
+        })
+    functions.sort(key=lambda el: el["total_time"], reverse=True)
+    return functions[:top]
+
+
+class Instrumentation:
+    """
+    Run the phases of a solver measuring wall and CPU time
+    and, optionally, the profile and the memory allocations.
+    """
+
+    def __init__(self, profile=False, trace_memory=False, top=20):
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self.top = top
+        self.profiles = dict()
+
+    def run(self, phase, function, *args):
+        """
+        :return: the result of function and the measurements
+        """
+        report = dict()
+        profile = cProfile.Profile() if self.profile else None
+        if self.trace_memory:
+            tracemalloc.start()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            if profile is not None:
+                result = profile.runcall(function, *args)
+            else:
+                result = function(*args)
+            report["wall"] = time.perf_counter() - wall_start
+            report["cpu"] = time.process_time() - cpu_start
+            if self.trace_memory:
+                report["current_bytes"], report["peak_bytes"] = tracemalloc.get_traced_memory()
+        finally:
+            if self.trace_memory:
+                tracemalloc.stop()
+        if profile is not None:
+            self.profiles[phase] = profile
+            report["top_functions"] = getTopFunctions(profile, self.top)
+        return result, report
+
+    def runSolver(self, solver, input_path, parts):
+        """
+        Parse the input and run the parts, in order, on the given solver.
+        :return: the measurements of each phase
+        """
+        reports = dict()
+        _, reports["parse"] = self.run("parse", solver.parse, input_path)
+        for part in parts:
+            _, reports[part] = self.run(part, getattr(solver, part))
+        return reports
+
+    def save(self, day, reports, output_dir):
+        """
+        Write the per-day report and, when profiling, the raw cProfile stats
+        that can be opened with pstats or snakeviz.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        with open(os.path.join(output_dir, "day%02d.json" % day), "w") as hand:
+            json.dump({"day": day, "phases": reports}, hand, indent=2)
+        for phase, profile in self.profiles.items():
+            profile.dump_stats(os.path.join(output_dir, "day%02d-%s.prof" % (day, phase)))
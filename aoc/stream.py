@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Solve a day in one pass over its input, read from a file or from the
+standard input, without keeping the whole input in memory.
+Only the days whose solver has a solveStream method are supported.
+"""
+import argparse
+import sys
+
+from aoc import days
+
+
+CHUNK_SIZE = 1 << 16
+
+# Days whose input is a single datastream, read in chunks instead of lines
+CHUNKED_DAYS = {6}
+
+
+def iterChunks(hand, chunk_size=CHUNK_SIZE):
+    while True:
+        chunk = hand.read(chunk_size)
+        if len(chunk) == 0:
+            return
+        yield chunk
+
+
+def solve(day, hand):
+    """
+    :return: the solver and the solutions of the day
+    """
+    solver = days.loadSolver(day)()
+    if not hasattr(solver, "solveStream"):
+        raise Exception("Day %d does not support streaming" % day)
+    lines = iterChunks(hand) if day in CHUNKED_DAYS else hand
+    return solver, solver.solveStream(lines)
+
+
+def buildParser():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("day", type=int)
+    parser.add_argument("input", nargs="?", default="-", help="input file, - for the standard input (default: -)")
+    return parser
+
+
+def main(argv=None):
+    args = buildParser().parse_args(argv)
+    try:
+        if args.input == "-":
+            solver, solutions = solve(args.day, sys.stdin)
+        else:
+            with open(args.input, "r") as hand:
+                solver, solutions = solve(args.day, hand)
+    except Exception as e:
+        sys.exit(str(e))
+    for i, solution in enumerate(solutions):
+        print(days.formatSolution(solver, i + 1, solution))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Compare the alternative backends of a day, listed in the BACKENDS dict
+of its solution, on the same generated input.
+Backends whose dependencies are missing are not listed by the day.
+"""
+import argparse
+import os
+import tempfile
+
+from aoc import days
+from aoc import generators
+from aoc.benchmark import positiveInt, timeCall
+
+
+def runBackend(solver_class, input_path, repeat):
+    """
+    :return: the solutions and the minimum time of each phase
+    """
+    timings = dict()
+    solutions = list()
+    for _ in range(repeat):
+        solver = solver_class()
+        _, elapsed = timeCall(solver.parse, input_path)
+        timings["parse"] = min(elapsed, timings.get("parse", elapsed))
+        solutions = list()
+        for part in days.getParts(solver_class):
+            solution, elapsed = timeCall(getattr(solver, part))
+            timings[part] = min(elapsed, timings.get(part, elapsed))
+            solutions.append(solution)
+    return solutions, timings
+
+
+def compareBackends(day, input_path, repeat=3):
+    backends = getattr(days.loadModule(day), "BACKENDS", None)
+    if backends is None:
+        raise Exception("Day %d has no alternative backends" % day)
+    phases = ["parse"] + days.getParts(days.loadSolver(day))
+    print("%-12s" % "backend" + "".join("%12s" % phase for phase in phases) + "%12s" % "total")
+    expected = None
+    for name, solver_class in backends.items():
+        solutions, timings = runBackend(solver_class, input_path, repeat)
+        if expected is None:
+            expected = solutions
+        if solutions != expected:
+            raise Exception("Backend %s returned %s instead of %s" % (name, solutions, expected))
+        print("%-12s" % name + "".join("%11.4fs" % timings[phase] for phase in phases)
+              + "%11.4fs" % sum(timings.values()))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("day", type=int)
+    parser.add_argument("--scale", type=int, default=100, help="scale of the generated input (default: 100)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--input", default=None, help="existing input file to use instead of a generated one")
+    parser.add_argument("--repeat", type=positiveInt, default=3)
+    args = parser.parse_args(argv)
+    if args.input is not None:
+        compareBackends(args.day, args.input, args.repeat)
+        return
+    with tempfile.TemporaryDirectory() as folder:
+        input_path = os.path.join(folder, "input")
+        generators.writeInput(args.day, input_path, args.scale, args.seed)
+        compareBackends(args.day, input_path, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Compare moving the crates of day 05 one at a time on deques
+with the slice transfers on lists used by the solution,
+on random moves of many crates each.
+"""
+import argparse
+import collections
+import random
+
+from aoc import days
+from aoc.benchmark import timeCall
+
+
+def generateMoves(rng, n_stacks, height, n_moves, max_crates):
+    heights = [height] * n_stacks
+    moves = list()
+    for _ in range(n_moves):
+        source = rng.choice([i for i in range(n_stacks) if heights[i] > 1])
+        target = rng.choice([i for i in range(n_stacks) if i != source])
+        n_el = rng.randint(1, min(heights[source] - 1, max_crates))
+        heights[source] -= n_el
+        heights[target] += n_el
+        moves.append((n_el, source + 1, target + 1))
+    return moves
+
+
+def moveOneByOne(move, current):
+    n_el, source, target = move
+    for _ in range(n_el):
+        current[target-1].append(current[source-1].pop())
+
+
+def moveOneByOne9001(move, current):
+    n_el, source, target = move
+    elements = collections.deque()
+    for _ in range(n_el):
+        elements.appendleft(current[source-1].pop())
+    current[target-1].extend(elements)
+
+
+def run(stacks, moves, mover):
+    for move in moves:
+        mover(move, stacks)
+    return "".join(stack[-1] for stack in stacks)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--stacks", type=int, default=9)
+    parser.add_argument("--height", type=int, default=10000, help="initial crates in each stack")
+    parser.add_argument("--moves", type=int, default=100000)
+    parser.add_argument("--max-crates", type=int, default=1000, help="maximum crates moved at once")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    rng = random.Random(args.seed)
+    crates = [[rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(args.height)] for _ in range(args.stacks)]
+    moves = generateMoves(rng, args.stacks, args.height, args.moves, args.max_crates)
+    solver = days.loadSolver(5)()
+    engines = {
+        "deque one by one": (collections.deque, moveOneByOne, moveOneByOne9001),
+        "list slices": (list, solver.apply_move, solver.apply_move9001)
+    }
+    print("%-18s %12s %12s %16s" % ("engine", "9000", "9001", "crates/s"))
+    n_crates = sum(n_el for n_el, _, _ in moves)
+    expected = None
+    for name, (container, mover, mover9001) in engines.items():
+        top, elapsed = timeCall(run, [container(stack) for stack in crates], moves, mover)
+        top9001, elapsed9001 = timeCall(run, [container(stack) for stack in crates], moves, mover9001)
+        if expected is None:
+            expected = (top, top9001)
+        assert (top, top9001) == expected
+        print("%-18s %11.4fs %11.4fs %16.0f" % (name, elapsed, elapsed9001, 2 * n_crates / (elapsed + elapsed9001)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Compare memory and probe throughput of the grid structures
+used by the solutions with aoc.grid.Grid.
+"""
+import argparse
+import random
+import tracemalloc
+
+from aoc.benchmark import timeCall
+from aoc.grid import Grid
+
+
+def measureMemory(build):
+    tracemalloc.start()
+    try:
+        structure = build()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return structure, current
+
+
+def buildStructures(lines):
+    return {
+        "list of str": lambda: [line.encode().decode() for line in lines],
+        "set of tuples": lambda: {(x, y) for y, line in enumerate(lines) for x, ch in enumerate(line) if ch == "#"},
+        "dict of tuples": lambda: {(x, y): [ch] for y, line in enumerate(lines) for x, ch in enumerate(line) if ch == "#"},
+        "Grid": lambda: Grid.fromLines(lines, bytes.maketrans(b".#", b"\x00\x01")),
+        "Grid packed": lambda: Grid.fromLines(lines, bytes.maketrans(b".#", b"\x00\x01")),
+    }
+
+
+def getProbe(name, structure):
+    if name == "list of str":
+        return lambda points: sum(1 for x, y in points if structure[y][x] == "#")
+    if name == "set of tuples" or name == "dict of tuples":
+        return lambda points: sum(1 for point in points if point in structure)
+    if name == "Grid":
+        return lambda points: sum(1 for x, y in points if structure.get(x, y))
+    cells = structure.cells
+    return lambda indexes: sum(1 for index in indexes if cells[index])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--side", type=int, default=1000)
+    parser.add_argument("--density", type=float, default=0.3)
+    parser.add_argument("--probes", type=int, default=1000000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    rng = random.Random(args.seed)
+    lines = ["".join("#" if rng.random() < args.density else "." for _ in range(args.side)) for _ in range(args.side)]
+    points = [(rng.randrange(args.side), rng.randrange(args.side)) for _ in range(args.probes)]
+    indexes = [y * args.side + x for x, y in points]
+    builders = buildStructures(lines)
+    print("%-16s %14s %16s" % ("structure", "memory (bytes)", "probes/s"))
+    expected = None
+    for name, build in builders.items():
+        structure, memory = measureMemory(build)
+        probe = getProbe(name, structure)
+        found, elapsed = timeCall(probe, indexes if name == "Grid packed" else points)
+        if expected is None:
+            expected = found
+        assert found == expected
+        print("%-16s %14d %16.0f" % (name, memory, args.probes / elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Compare memory and insertion throughput of the structures storing
+the positions visited by the tail in day 09, on a random walk.
+"""
+import argparse
+import random
+import tracemalloc
+
+from aoc import days
+from aoc.benchmark import timeCall
+
+
+def generateWalk(rng, steps):
+    xs = list()
+    ys = list()
+    x, y = 0, 0
+    for _ in range(steps):
+        x += rng.randint(-1, 1)
+        y += rng.randint(-1, 1)
+        xs.append(x)
+        ys.append(y)
+    return xs, ys
+
+
+def storeTuples(xs, ys):
+    visited = set()
+    for x, y in zip(xs, ys):
+        visited.add((x, y))
+    return visited
+
+
+def storePacked(xs, ys):
+    stride = days.loadModule(9).STRIDE
+    visited = set()
+    for x, y in zip(xs, ys):
+        visited.add(x * stride + y)
+    return visited
+
+
+def storePackedArray(xs, ys):
+    module = days.loadModule(9)
+    stride = module.STRIDE
+    visited = module.PackedPositions()
+    for x, y in zip(xs, ys):
+        visited.add(x * stride + y)
+        visited.mergeIfFull()
+    visited.merge()
+    return visited
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--steps", type=int, default=10000000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    xs, ys = generateWalk(random.Random(args.seed), args.steps)
+    print("%-16s %10s %14s %14s %14s" % ("structure", "visited", "memory (bytes)", "peak (bytes)", "steps/s"))
+    expected = None
+    structures = (("set of tuples", storeTuples), ("set of packed", storePacked),
+                  ("array of packed", storePackedArray))
+    for name, store in structures:
+        visited, elapsed = timeCall(store, xs, ys)
+        del visited
+        # Measured separately, tracing slows down the allocations
+        tracemalloc.start()
+        try:
+            visited = store(xs, ys)
+            memory, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        if expected is None:
+            expected = len(visited)
+        assert len(visited) == expected
+        print("%-16s %10d %14d %14d %14.0f" % (name, len(visited), memory, peak, args.steps / elapsed))
+        del visited
+
+
+if __name__ == "__main__":
+    main()